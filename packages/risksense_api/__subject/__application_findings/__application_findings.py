@@ -8,7 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
 import datetime
 from ..__exports import ExportFileType
 from ...__subject import Subject
@@ -259,7 +258,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/assign"
+        url = self._client_url(client_id) + "/assign"
 
         body = {
             "filters": search_filters,
@@ -271,7 +270,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -301,7 +300,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/unassign"
+        url = self._client_url(client_id) + "/unassign"
 
         body = {
             "filters": search_filters,
@@ -313,7 +312,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -386,7 +385,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/update-due-date"
+        url = self._client_url(client_id) + "/update-due-date"
 
         body = {
             "filterRequest": {
@@ -400,7 +399,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -430,7 +429,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/note"
+        url = self._client_url(client_id) + "/note"
 
         body = {
             "filterRequest": {
@@ -444,7 +443,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -487,7 +486,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/acceptance/request"
+        url = self._client_url(client_id) + "/acceptance/request"
 
         body = {
             "filterRequest": filter_request,
@@ -505,7 +504,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -548,7 +547,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/falsePositive/request"
+        url = self._client_url(client_id) + "/falsePositive/request"
 
         body = {
             "filterRequest": filter_request,
@@ -566,7 +565,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -609,7 +608,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/remediation/request"
+        url = self._client_url(client_id) + "/remediation/request"
 
         body = {
             "filterRequest": filter_request,
@@ -627,7 +626,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -673,7 +672,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/severityChange/request"
+        url = self._client_url(client_id) + "/severityChange/request"
 
         body = {
             "filterRequest": filter_request,
@@ -692,7 +691,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -722,7 +721,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/acceptance/reject"
+        url = self._client_url(client_id) + "/acceptance/reject"
 
         body = {
             "filterRequest": {
@@ -745,7 +744,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -775,7 +774,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/falsePositive/reject"
+        url = self._client_url(client_id) + "/falsePositive/reject"
 
         body = {
             "filterRequest": {
@@ -798,7 +797,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -828,7 +827,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/remediation/reject"
+        url = self._client_url(client_id) + "/remediation/reject"
 
         body = {
             "filterRequest": {
@@ -851,7 +850,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -881,7 +880,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/severityChange/reject"
+        url = self._client_url(client_id) + "/severityChange/reject"
 
         body = {
             "filterRequest": {
@@ -904,7 +903,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -934,7 +933,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/acceptance/rework"
+        url = self._client_url(client_id) + "/acceptance/rework"
 
         body = {
             "filterRequest": {
@@ -957,7 +956,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -987,7 +986,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/falsePositive/rework"
+        url = self._client_url(client_id) + "/falsePositive/rework"
 
         body = {
             "filterRequest": {
@@ -1010,7 +1009,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1040,7 +1039,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/remediation/rework"
+        url = self._client_url(client_id) + "/remediation/rework"
 
         body = {
             "filterRequest": {
@@ -1063,7 +1062,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1093,7 +1092,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/severityChange/rework"
+        url = self._client_url(client_id) + "/severityChange/rework"
 
         body = {
             "filterRequest": {
@@ -1116,7 +1115,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1150,7 +1149,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/acceptance/approve"
+        url = self._client_url(client_id) + "/acceptance/approve"
 
         body = {
             "filterRequest": {
@@ -1174,7 +1173,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1208,7 +1207,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/falsePositive/approve"
+        url = self._client_url(client_id) + "/falsePositive/approve"
 
         body = {
             "filterRequest": {
@@ -1232,7 +1231,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1266,7 +1265,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/remediation/approve"
+        url = self._client_url(client_id) + "/remediation/approve"
 
         body = {
             "filterRequest": {
@@ -1290,7 +1289,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1324,7 +1323,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/severityChange/approve"
+        url = self._client_url(client_id) + "/severityChange/approve"
 
         body = {
             "filterRequest": {
@@ -1348,7 +1347,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1375,7 +1374,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/delete"
+        url = self._client_url(client_id) + "/delete"
 
         body = {
             "filterRequest": {
@@ -1388,7 +1387,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1481,7 +1480,7 @@ class ApplicationFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/tag"
+        url = self._client_url(client_id) + "/tag"
 
         body = {
             "tagId": tag_id,
@@ -1496,7 +1495,7 @@ class ApplicationFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
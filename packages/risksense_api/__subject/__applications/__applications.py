@@ -8,7 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
 from ..__exports import ExportFileType
 from ...__subject import Subject
 from ..._params import *
@@ -187,7 +186,7 @@ class Applications(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/tag"
+        url = self._client_url(client_id) + "/tag"
 
         body = {
             "tagId": tag_id,
@@ -202,7 +201,7 @@ class Applications(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -232,7 +231,7 @@ class Applications(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/tag"
+        url = self._client_url(client_id) + "/tag"
 
         body = {
             "tagId": tag_id,
@@ -247,7 +246,7 @@ class Applications(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -322,7 +321,7 @@ class Applications(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/network/move"
+        url = self._client_url(client_id) + "/network/move"
 
         body = {
             "filterRequest": {
@@ -337,7 +336,7 @@ class Applications(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -364,7 +363,7 @@ class Applications(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/update-remediation-by-assessment"
+        url = self._client_url(client_id) + "/update-remediation-by-assessment"
 
         body = {
             "filterRequest": {
@@ -377,7 +376,7 @@ class Applications(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -407,7 +406,7 @@ class Applications(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/note"
+        url = self._client_url(client_id) + "/note"
 
         body = {
             "filterRequest": {
@@ -421,7 +420,7 @@ class Applications(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
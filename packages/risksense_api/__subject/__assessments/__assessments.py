@@ -8,7 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
 from ...__subject import Subject
 from ..._params import *
 from ..._api_request_handler import *
@@ -59,7 +58,7 @@ class Assessments(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id))
+        url = self._client_url(client_id)
 
         body = {
             "name": name,
@@ -73,7 +72,7 @@ class Assessments(Subject):
             print(f"There was a problem creating new assessment {name}.")
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         assessment_id = jsonified_response['id']
 
         return assessment_id
@@ -109,7 +108,7 @@ class Assessments(Subject):
         start_date = kwargs.get('start_date', None)
         notes = kwargs.get('notes', None)
 
-        url = self.api_base_url.format(str(client_id)) + "/" + str(assessment_id)
+        url = self._client_url(client_id) + "/" + str(assessment_id)
 
         body = {}
 
@@ -130,7 +129,7 @@ class Assessments(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         returned_id = jsonified_response['id']
 
         return returned_id
@@ -157,14 +156,14 @@ class Assessments(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/" + str(assessment_id)
+        url = self._client_url(client_id) + "/" + str(assessment_id)
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.DELETE, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -292,14 +291,14 @@ class Assessments(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/" + str(assessment_id) + "/attachment"
+        url = self._client_url(client_id) + "/" + str(assessment_id) + "/attachment"
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -333,7 +332,7 @@ class Assessments(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/" + str(assessment_id) + "/attachment/" + str(attachment_uuid)
+        url = self._client_url(client_id) + "/" + str(assessment_id) + "/attachment/" + str(attachment_uuid)
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
@@ -375,14 +374,14 @@ class Assessments(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/" + str(assessment_id) + "/attachment/" + str(attachment_uuid) + "/meta"
+        url = self._client_url(client_id) + "/" + str(assessment_id) + "/attachment/" + str(attachment_uuid) + "/meta"
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_data = json.loads(raw_response.text)
+        jsonified_data = parse_json_response(raw_response)
 
         return jsonified_data
 
@@ -8,7 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
 from ...__subject import Subject
 from ..._api_request_handler import *
 
@@ -65,7 +64,7 @@ class Attachments(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         file_uuid = jsonified_response['uuid']
 
         return file_uuid
@@ -99,7 +98,7 @@ class Attachments(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -181,7 +180,7 @@ class Attachments(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         returned_id = jsonified_response['id']
 
         return returned_id
@@ -218,7 +217,7 @@ class Attachments(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
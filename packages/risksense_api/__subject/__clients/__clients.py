@@ -8,8 +8,8 @@
 |
 ******************************************************************************************************************* """
 
-import json
 from ...__subject import Subject
+from ..._params import *
 from ..._api_request_handler import *
 
 
@@ -29,7 +29,7 @@ class Clients(Subject):
         Subject.__init__(self, profile, self.subject_name)
         self.api_base_url = self.profile.platform_url + "/api/v1/client"
 
-    def get_clients(self, page_size=500, page_number=0):
+    def get_clients(self, page_size=500, page_number=0, sort_field=None, sort_dir=SortDirection.ASC):
 
         """
         Gets all clients associated with the API key.
@@ -40,6 +40,12 @@ class Clients(Subject):
         :param page_number:     The page number to be returned.
         :type  page_number:     int
 
+        :param sort_field:      Name of field to sort results on.  If not provided, results are unsorted.
+        :type  sort_field:      SortField attribute
+
+        :param sort_dir:        Direction to sort. SortDirection.ASC or SortDirection.DESC
+        :type  sort_dir:        SortDirection attribute
+
         :return:    The JSON response from the platform is returned.
         :rtype:     dict
 
@@ -56,12 +62,15 @@ class Clients(Subject):
             "page": page_number
         }
 
+        if sort_field is not None:
+            params.update({"sort": "{},{}".format(sort_field, sort_dir)})
+
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url, params=params)
         except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -88,7 +97,7 @@ class Clients(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -117,7 +126,7 @@ class Clients(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -8,7 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
 from ...__subject import Subject
 from ..._api_request_handler import *
 
@@ -70,14 +69,14 @@ class Connectors(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "?size=" + str(page_size) + "&page=" + str(page_num)
+        url = self._client_url(client_id) + "?size=" + str(page_size) + "&page=" + str(page_num)
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -135,7 +134,7 @@ class Connectors(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id))
+        url = self._client_url(client_id)
 
         ssl_cert = kwargs.get('ssl_cert', None)
         hour_of_day = kwargs.get('hour_of_day', None)
@@ -217,7 +216,7 @@ class Connectors(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -529,14 +528,14 @@ class Connectors(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(connector_id))
+        url = self._client_url(client_id) + "/{}".format(str(connector_id))
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -599,7 +598,7 @@ class Connectors(Subject):
 
         connector_schedule = None
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(connector_id))
+        url = self._client_url(client_id) + "/{}".format(str(connector_id))
 
         hour_of_day = kwargs.get('hour_of_day', None)
         day_of_week = kwargs.get('day_of_week', None)
@@ -672,7 +671,7 @@ class Connectors(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         returned_id = jsonified_response['id']
 
         return returned_id
@@ -992,7 +991,7 @@ class Connectors(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(connector_id))
+        url = self._client_url(client_id) + "/{}".format(str(connector_id))
 
         body = {
             "deleteTag": delete_tag
@@ -1036,7 +1035,7 @@ class Connectors(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/job".format(str(connector_id))
+        url = self._client_url(client_id) + "/{}/job".format(str(connector_id))
 
         params = {'page': page_num, 'size': page_size}
 
@@ -1045,7 +1044,7 @@ class Connectors(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -1088,7 +1087,7 @@ class Connectors(Subject):
         day_of_week = kwargs.get('day_of_week', None)
         day_of_month = kwargs.get('day_of_month', None)
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/schedule".format(str(connector_id))
+        url = self._client_url(client_id) + "/{}/schedule".format(str(connector_id))
 
         body = {
             "type": schedule_freq,
@@ -1138,7 +1137,7 @@ class Connectors(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         returned_id = jsonified_response['id']
 
         return returned_id
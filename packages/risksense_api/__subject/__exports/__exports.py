@@ -8,7 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
 from ...__subject import Subject
 from ..._api_request_handler import *
 
@@ -59,14 +58,14 @@ class Exports(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/status".format(str(export_id))
+        url = self._client_url(client_id) + "/{}/status".format(str(export_id))
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         export_status = jsonified_response['status']
 
         return export_status
@@ -98,7 +97,7 @@ class Exports(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(export_id))
+        url = self._client_url(client_id) + "/{}".format(str(export_id))
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
@@ -138,7 +137,7 @@ class Exports(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(export_id))
+        url = self._client_url(client_id) + "/{}".format(str(export_id))
 
         try:
             self.request_handler.make_request(ApiRequestHandler.DELETE, url)
@@ -8,7 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
 from ...__subject import Subject
 from ..._api_request_handler import *
 
@@ -100,7 +99,7 @@ class Filters(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -577,14 +576,14 @@ class Filters(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/filter".format(filter_subject)
+        url = self._client_url(client_id) + "/{}/filter".format(filter_subject)
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -631,14 +630,14 @@ class Filters(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/filter/{}".format(filter_subject, str(filter_id))
+        url = self._client_url(client_id) + "/{}/filter/{}".format(filter_subject, str(filter_id))
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -704,7 +703,7 @@ class Filters(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         filter_id = jsonified_response['id']
 
         return filter_id
@@ -1342,7 +1341,7 @@ class Filters(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -8,7 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
 from ...__subject import Subject
 from ..._params import *
 from ..._api_request_handler import *
@@ -160,7 +159,7 @@ class Groups(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id))
+        url = self._client_url(client_id)
 
         body = {
             "name": name
@@ -171,7 +170,7 @@ class Groups(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         new_group_id = jsonified_response['id']
 
         return new_group_id
@@ -198,7 +197,7 @@ class Groups(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/delete"
+        url = self._client_url(client_id) + "/delete"
 
         body = {
             "filterRequest": {
@@ -211,7 +210,7 @@ class Groups(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         deleted_groups = jsonified_response['projections']['fields']
 
         return deleted_groups
@@ -245,7 +244,7 @@ class Groups(Subject):
         name = kwargs.get('name', None)
         asset_criticality = kwargs.get('asset_criticality', None)
 
-        url = self.api_base_url.format(str(client_id)) + "/" + str(group_id)
+        url = self._client_url(client_id) + "/" + str(group_id)
 
         body = {}
 
@@ -263,7 +262,7 @@ class Groups(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -300,14 +299,14 @@ class Groups(Subject):
             }
         }
 
-        url = self.api_base_url.format(str(client_id)) + "/update"
+        url = self._client_url(client_id) + "/update"
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.POST, url, body=body)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -337,7 +336,7 @@ class Groups(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/assign"
+        url = self._client_url(client_id) + "/assign"
 
         body = {
             "filters": search_filters,
@@ -349,7 +348,7 @@ class Groups(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -379,7 +378,7 @@ class Groups(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/unassign"
+        url = self._client_url(client_id) + "/unassign"
 
         body = {
             "filters": search_filters,
@@ -391,7 +390,7 @@ class Groups(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
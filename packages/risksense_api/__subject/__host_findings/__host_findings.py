@@ -8,7 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
 import datetime
 from ..__exports import ExportFileType
 from ...__subject import Subject
@@ -83,7 +82,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id))
+        url = self._client_url(client_id)
 
         synopsis = kwargs.get("synopsis", None)
         service = kwargs.get("service", None)
@@ -111,7 +110,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         hostfinding_id = jsonified_response['id']
 
         return hostfinding_id
@@ -155,7 +154,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/search"
+        url = self._client_url(client_id) + "/search"
 
         body = {
             "filters": search_filters,
@@ -175,7 +174,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -291,7 +290,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/tag"
+        url = self._client_url(client_id) + "/tag"
 
         body = {
             "tagId": tag_id,
@@ -306,7 +305,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -336,7 +335,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/tag"
+        url = self._client_url(client_id) + "/tag"
 
         body = {
             "tagId": tag_id,
@@ -351,7 +350,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -381,7 +380,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/assign"
+        url = self._client_url(client_id) + "/assign"
 
         body = {
             "filters": search_filters,
@@ -393,7 +392,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -423,7 +422,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/unassign"
+        url = self._client_url(client_id) + "/unassign"
 
         body = {
             "filters": search_filters,
@@ -435,7 +434,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -509,7 +508,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/update-due-date"
+        url = self._client_url(client_id) + "/update-due-date"
 
         body = {
             "filterRequest": {
@@ -523,7 +522,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -553,7 +552,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/note"
+        url = self._client_url(client_id) + "/note"
 
         body = {
             "filterRequest": {
@@ -567,7 +566,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -594,7 +593,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/delete"
+        url = self._client_url(client_id) + "/delete"
 
         body = {
             "filterRequest": {
@@ -607,7 +606,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -650,7 +649,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/acceptance/request"
+        url = self._client_url(client_id) + "/acceptance/request"
 
         body = {
             "filterRequest": filter_request,
@@ -668,7 +667,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -711,7 +710,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/falsePositive/request"
+        url = self._client_url(client_id) + "/falsePositive/request"
 
         body = {
             "filterRequest": filter_request,
@@ -729,7 +728,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -772,7 +771,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/remediation/request"
+        url = self._client_url(client_id) + "/remediation/request"
 
         body = {
             "filterRequest": filter_request,
@@ -790,7 +789,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -836,7 +835,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/severityChange/request"
+        url = self._client_url(client_id) + "/severityChange/request"
 
         body = {
             "filterRequest": filter_request,
@@ -855,7 +854,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -885,7 +884,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/acceptance/reject"
+        url = self._client_url(client_id) + "/acceptance/reject"
 
         body = {
             "filterRequest": {
@@ -908,7 +907,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -938,7 +937,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/falsePositive/reject"
+        url = self._client_url(client_id) + "/falsePositive/reject"
 
         body = {
             "filterRequest": {
@@ -961,7 +960,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -991,7 +990,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/remediation/reject"
+        url = self._client_url(client_id) + "/remediation/reject"
 
         body = {
             "filterRequest": {
@@ -1014,7 +1013,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1044,7 +1043,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/severityChange/reject"
+        url = self._client_url(client_id) + "/severityChange/reject"
 
         body = {
             "filterRequest": {
@@ -1067,7 +1066,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1097,7 +1096,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/acceptance/rework"
+        url = self._client_url(client_id) + "/acceptance/rework"
 
         body = {
             "filterRequest": {
@@ -1120,7 +1119,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1150,7 +1149,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/falsePositive/rework"
+        url = self._client_url(client_id) + "/falsePositive/rework"
 
         body = {
             "filterRequest": {
@@ -1173,7 +1172,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1203,7 +1202,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/remediation/rework"
+        url = self._client_url(client_id) + "/remediation/rework"
 
         body = {
             "filterRequest": {
@@ -1226,7 +1225,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1256,7 +1255,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/severityChange/rework"
+        url = self._client_url(client_id) + "/severityChange/rework"
 
         body = {
             "filterRequest": {
@@ -1279,7 +1278,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1313,7 +1312,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/acceptance/approve"
+        url = self._client_url(client_id) + "/acceptance/approve"
 
         body = {
             "filterRequest": {
@@ -1337,7 +1336,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1371,7 +1370,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/falsePositive/approve"
+        url = self._client_url(client_id) + "/falsePositive/approve"
 
         body = {
             "filterRequest": {
@@ -1395,7 +1394,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1429,7 +1428,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/remediation/approve"
+        url = self._client_url(client_id) + "/remediation/approve"
 
         body = {
             "filterRequest": {
@@ -1453,7 +1452,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -1487,7 +1486,7 @@ class HostFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/severityChange/approve"
+        url = self._client_url(client_id) + "/severityChange/approve"
 
         body = {
             "filterRequest": {
@@ -1511,7 +1510,7 @@ class HostFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
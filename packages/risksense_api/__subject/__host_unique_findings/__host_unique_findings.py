@@ -8,7 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
 from ..__exports import ExportFileType
 from ...__subject import Subject
 from ..._params import *
@@ -67,7 +66,7 @@ class HostUniqueFindings(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/search"
+        url = self._client_url(client_id) + "/search"
 
         body = {
             "filters": search_filters,
@@ -87,7 +86,7 @@ class HostUniqueFindings(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
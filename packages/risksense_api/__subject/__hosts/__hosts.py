@@ -8,7 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
 from ..__exports import ExportFileType
 from ...__subject import Subject
 from ..._params import *
@@ -101,7 +100,7 @@ class Hosts(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id))
+        url = self._client_url(client_id)
 
         manufactured_by = kwargs.get("manufactured_by", None)
         model = kwargs.get("model", None)
@@ -178,7 +177,7 @@ class Hosts(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -200,7 +199,7 @@ class Hosts(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/delete"
+        url = self._client_url(client_id) + "/delete"
 
         body = {
             "filterRequest": {
@@ -213,7 +212,7 @@ class Hosts(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -249,7 +248,7 @@ class Hosts(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/update"
+        url = self._client_url(client_id) + "/update"
 
         ip_address = kwargs.get("ip_address", None)
         hostname = kwargs.get("hostname", None)
@@ -279,7 +278,7 @@ class Hosts(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -331,7 +330,7 @@ class Hosts(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/update"
+        url = self._client_url(client_id) + "/update"
 
         o_s = kwargs.get("os", None)
         manufacturer = kwargs.get("manufacturer", None)
@@ -399,7 +398,7 @@ class Hosts(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -443,7 +442,7 @@ class Hosts(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/search"
+        url = self._client_url(client_id) + "/search"
 
         body = {
             "filters": search_filters,
@@ -463,7 +462,7 @@ class Hosts(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -579,7 +578,7 @@ class Hosts(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/tag"
+        url = self._client_url(client_id) + "/tag"
 
         body = {
             "tagId": tag_id,
@@ -594,7 +593,7 @@ class Hosts(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -624,7 +623,7 @@ class Hosts(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/tag"
+        url = self._client_url(client_id) + "/tag"
 
         body = {
             "tagId": tag_id,
@@ -639,7 +638,7 @@ class Hosts(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -715,7 +714,7 @@ class Hosts(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/network/move"
+        url = self._client_url(client_id) + "/network/move"
 
         body = {
             "filterRequest": {
@@ -730,7 +729,7 @@ class Hosts(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -757,7 +756,7 @@ class Hosts(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/update-remediation-by-assessment"
+        url = self._client_url(client_id) + "/update-remediation-by-assessment"
 
         body = {
             "filterRequest": {
@@ -770,7 +769,7 @@ class Hosts(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -800,7 +799,7 @@ class Hosts(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/note"
+        url = self._client_url(client_id) + "/note"
 
         body = {
             "filterRequest": {
@@ -814,7 +813,7 @@ class Hosts(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -8,7 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
 from ...__subject import Subject
 from ..._params import *
 from ..._api_request_handler import *
@@ -56,7 +55,7 @@ class Networks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id))
+        url = self._client_url(client_id)
 
         body = {
             "name": name,
@@ -68,7 +67,7 @@ class Networks(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         network_id = jsonified_response['id']
 
         return network_id
@@ -99,7 +98,7 @@ class Networks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(network_id))
+        url = self._client_url(client_id) + "/{}".format(str(network_id))
 
         name = kwargs.get('name', None)
         network_type = kwargs.get('network_type', None)
@@ -119,7 +118,7 @@ class Networks(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response)
+        jsonified_response = parse_json_response(raw_response)
         returned_id = jsonified_response['id']
 
         return returned_id
@@ -146,7 +145,7 @@ class Networks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(network_id))
+        url = self._client_url(client_id) + "/{}".format(str(network_id))
 
         try:
             self.request_handler.make_request(ApiRequestHandler.DELETE, url)
@@ -193,7 +192,7 @@ class Networks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/search"
+        url = self._client_url(client_id) + "/search"
 
         body = {
             "filters": search_filters,
@@ -213,7 +212,7 @@ class Networks(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -256,19 +255,25 @@ class Networks(Subject):
         if client_id is None:
             client_id, func_args['client_id'] = self._use_default_client_id()
 
+        #  The first page also carries the page info, so it isn't requested separately.
         try:
-            page_info = self._get_page_info(self.subject_name, search_filters, page_size=page_size, client_id=client_id)
-            num_pages = page_info[1]
+            first_page = self.get_single_search_page(search_filters, page_num=0, page_size=page_size,
+                                                     sort_field=sort_field, sort_dir=sort_dir, client_id=client_id)
+            num_pages = first_page['page']['totalPages']
         except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
             print("There was a problem with the networks search.")
             raise
 
-        page_range = range(0, num_pages)
+        if '_embedded' in first_page:
+            all_results.extend(first_page['_embedded'][self.subject_name + 's'])
 
-        try:
-            all_results = self._search(self.subject_name, self.get_single_search_page, page_range, **func_args)
-        except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
-            raise
+        page_range = range(1, num_pages)
+
+        if num_pages > 1:
+            try:
+                all_results.extend(self._search(self.subject_name, self.get_single_search_page, page_range, **func_args))
+            except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
+                raise
 
         return all_results
 
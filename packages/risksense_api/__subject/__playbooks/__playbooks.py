@@ -9,7 +9,6 @@
 ******************************************************************************************************************* """
 
 import json
-import time
 import concurrent.futures
 import progressbar
 from ...__subject import Subject
@@ -52,14 +51,14 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/supported-inputs"
+        url = self._client_url(client_id) + "/supported-inputs"
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        supported_inputs = json.loads(raw_response.text)
+        supported_inputs = parse_json_response(raw_response)
 
         return supported_inputs
 
@@ -82,14 +81,14 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/supported-actions"
+        url = self._client_url(client_id) + "/supported-actions"
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        supported_actions = json.loads(raw_response.text)
+        supported_actions = parse_json_response(raw_response)
 
         return supported_actions
 
@@ -112,14 +111,14 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/supported-frequencies"
+        url = self._client_url(client_id) + "/supported-frequencies"
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        supported_frequencies = json.loads(raw_response.text)
+        supported_frequencies = parse_json_response(raw_response)
 
         return supported_frequencies
 
@@ -142,14 +141,14 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/supported-outputs"
+        url = self._client_url(client_id) + "/supported-outputs"
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        supported_outputs = json.loads(raw_response.text)
+        supported_outputs = parse_json_response(raw_response)
 
         return supported_outputs
 
@@ -172,14 +171,14 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/subject-supported-actions"
+        url = self._client_url(client_id) + "/subject-supported-actions"
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        supported_actions = json.loads(raw_response.text)
+        supported_actions = parse_json_response(raw_response)
 
         return supported_actions
 
@@ -215,7 +214,7 @@ class Playbooks(Subject):
         if page_size > 1000:
             raise PageSizeError("Page size must be <= 1000")
 
-        url = self.api_base_url.format(str(client_id)) + "/fetch"
+        url = self._client_url(client_id) + "/fetch"
 
         params = {
             "size": page_size,
@@ -228,7 +227,7 @@ class Playbooks(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -251,7 +250,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/fetch"
+        url = self._client_url(client_id) + "/fetch"
 
         try:
             num_pages = self._get_playbook_page_info(url, page_size=1000)
@@ -289,14 +288,14 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/fetch/{}".format(playbook_uuid)
+        url = self._client_url(client_id) + "/fetch/{}".format(playbook_uuid)
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -341,14 +340,14 @@ class Playbooks(Subject):
             "sort": sort_dir
         }
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/rules".format(playbook_uuid)
+        url = self._client_url(client_id) + "/{}/rules".format(playbook_uuid)
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url, params=params)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -377,7 +376,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/rules".format(playbook_uuid)
+        url = self._client_url(client_id) + "/{}/rules".format(playbook_uuid)
 
         page_size = 1000
 
@@ -446,7 +445,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/rule".format(playbook_uuid)
+        url = self._client_url(client_id) + "/{}/rule".format(playbook_uuid)
 
         body = {
             "name": rule_name,
@@ -463,7 +462,7 @@ class Playbooks(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -518,7 +517,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/rule/with-files".format(playbook_uuid)
+        url = self._client_url(client_id) + "/{}/rule/with-files".format(playbook_uuid)
 
         rule = {
             "name": rule_name,
@@ -546,7 +545,7 @@ class Playbooks(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -588,7 +587,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id))
+        url = self._client_url(client_id)
 
         day_of_week = kwargs.get("day_of_week", None)
         day_of_month = kwargs.get("day_of_month", None)
@@ -625,7 +624,7 @@ class Playbooks(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         new_playbook_uuid = jsonified_response['uuid']
 
         return new_playbook_uuid
@@ -669,7 +668,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(playbook_uuid)
+        url = self._client_url(client_id) + "/{}".format(playbook_uuid)
 
         day_of_week = kwargs.get("day_of_week", None)
         day_of_month = kwargs.get("day_of_month", None)
@@ -706,7 +705,7 @@ class Playbooks(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -734,7 +733,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(playbook_uuid)
+        url = self._client_url(client_id) + "/{}".format(playbook_uuid)
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.DELETE, url)
@@ -767,14 +766,14 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(playbook_uuid)
+        url = self._client_url(client_id) + "/{}".format(playbook_uuid)
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -803,7 +802,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/rule-reorder".format(playbook_uuid)
+        url = self._client_url(client_id) + "/{}/rule-reorder".format(playbook_uuid)
 
         if type(rule_uuids) is not list:
             raise ValueError(f"rule_uuids should be a list of strings.")
@@ -817,7 +816,7 @@ class Playbooks(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -866,7 +865,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/rule/{}".format(rule_uuid)
+        url = self._client_url(client_id) + "/rule/{}".format(rule_uuid)
 
         try:
             supported_inputs = self.get_supported_inputs(client_id)
@@ -931,7 +930,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/rule/{}".format(rule_uuid)
+        url = self._client_url(client_id) + "/rule/{}".format(rule_uuid)
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.DELETE, url)
@@ -962,14 +961,14 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/rule/{}".format(rule_uuid)
+        url = self._client_url(client_id) + "/rule/{}".format(rule_uuid)
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -998,7 +997,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/rule/{}/file/{}".format(rule_uuid, file_uuid)
+        url = self._client_url(client_id) + "/rule/{}/file/{}".format(rule_uuid, file_uuid)
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.DELETE, url)
@@ -1037,7 +1036,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/rule/{}/file/{}".format(rule_uuid, file_uuid)
+        url = self._client_url(client_id) + "/rule/{}/file/{}".format(rule_uuid, file_uuid)
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
@@ -1076,7 +1075,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/rule/{}/file".format(rule_uuid)
+        url = self._client_url(client_id) + "/rule/{}/file".format(rule_uuid)
 
         upload_file = {'file': (file_name, open(file_path, 'rb'))}
 
@@ -1087,7 +1086,7 @@ class Playbooks(Subject):
         except FileNotFoundError:
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -1113,7 +1112,7 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/toggle-enabled"
+        url = self._client_url(client_id) + "/toggle-enabled"
 
         body = {
             "playbookUuids": playbook_uuids,
@@ -1125,7 +1124,7 @@ class Playbooks(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -1147,14 +1146,14 @@ class Playbooks(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/run".format(playbook_uuid)
+        url = self._client_url(client_id) + "/{}/run".format(playbook_uuid)
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -1189,7 +1188,7 @@ class Playbooks(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         total_pages = jsonified_response['totalPages']
 
         return total_pages
@@ -1229,10 +1228,9 @@ class Playbooks(Subject):
             prog_bar = progressbar.ProgressBar(max_value=max_val)
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.profile.num_thread_workers) as executor:
-            counter = 1
             future_to_page = {executor.submit(func_name, page_num=page, **func_args): page for page in page_range}
 
-            for future in concurrent.futures.as_completed(future_to_page):
+            for counter, future in enumerate(concurrent.futures.as_completed(future_to_page), start=1):
                 try:
                     data = future.result()
                 except PageSizeError:
@@ -1242,13 +1240,10 @@ class Playbooks(Subject):
 
                 if 'content' in data:
                     items = data['content']
-                    for item in items:
-                        all_results.append(item)
+                    all_results.extend(items)
 
                 if self.profile.use_prog_bar:
                     prog_bar.update(counter)
-                    time.sleep(0.1)
-                    counter += 1
 
         if self.profile.use_prog_bar:
             prog_bar.finish()
@@ -8,8 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
-import time
 import concurrent.futures
 import progressbar
 from .._params import *
@@ -26,8 +24,33 @@ class Subject:
 
         self.profile = profile
         self.subject_name = subject_name
-        self.request_handler = ApiRequestHandler(self.profile.api_key, proxy=self.profile.proxy)
+
+        if self.profile.request_handler is not None:
+            self.request_handler = self.profile.request_handler
+        else:
+            self.request_handler = ApiRequestHandler(self.profile.api_key, proxy=self.profile.proxy)
+
         self.api_base_url = self.profile.platform_url + "/api/v1/client/{}/" + subject_name
+        self.__client_urls = {}
+
+    def _client_url(self, client_id):
+
+        """
+        Get the base URL of the subject for a client.  The URL is only built once per client.
+
+        :param client_id:   Client ID
+        :type  client_id:   int
+
+        :return:    Base URL for the client
+        :rtype:     str
+        """
+
+        url = self.__client_urls.get(client_id)
+
+        if url is None:
+            url = self.__client_urls[client_id] = self.api_base_url.format(str(client_id))
+
+        return url
 
     def bulk_filtered_op(self, func_name, list_of_filters, client_id, **func_args):
 
@@ -62,11 +85,10 @@ class Subject:
             prog_bar = progressbar.ProgressBar(max_value=filter_count)
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.profile.num_thread_workers) as executor:
-            counter = 1
             future_to_filter = {executor.submit(func_name, filter_x, client_id=client_id,
                                                 **func_args): filter_x for filter_x in list_of_filters}
 
-            for future in concurrent.futures.as_completed(future_to_filter):
+            for counter, future in enumerate(concurrent.futures.as_completed(future_to_filter), start=1):
                 try:
                     data = future.result()
                 except (RequestFailed, StatusCodeError, MaxRetryError):
@@ -77,8 +99,6 @@ class Subject:
 
                 if self.profile.use_prog_bar:
                     prog_bar.update(counter)
-                    time.sleep(0.1)
-                    counter += 1
 
         if self.profile.use_prog_bar:
             prog_bar.finish()
@@ -115,10 +135,9 @@ class Subject:
             prog_bar = progressbar.ProgressBar(max_value=num_to_process)
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.profile.num_workers) as executor:
-            counter = 1
             future_to_process = {executor.submit(func_name, client_id=client_id, **func_args): func_args for func_args in list_of_args}
 
-            for future in concurrent.futures.as_completed(future_to_process):
+            for counter, future in enumerate(concurrent.futures.as_completed(future_to_process), start=1):
                 try:
                     data = future.result()
                 except (RequestFailed, StatusCodeError, MaxRetryError):
@@ -129,8 +148,6 @@ class Subject:
 
                 if self.profile.use_prog_bar:
                     prog_bar.update(counter)
-                    time.sleep(0.1)
-                    counter += 1
 
         if self.profile.use_prog_bar:
             prog_bar.finish()
@@ -216,7 +233,7 @@ class Subject:
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         export_id = jsonified_response['id']
 
         return export_id
@@ -247,7 +264,7 @@ class Subject:
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         available_filters = jsonified_response
 
         return available_filters
@@ -279,7 +296,7 @@ class Subject:
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -320,7 +337,7 @@ class Subject:
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -363,7 +380,7 @@ class Subject:
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -407,7 +424,7 @@ class Subject:
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -459,7 +476,7 @@ class Subject:
         except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -501,10 +518,9 @@ class Subject:
             prog_bar = progressbar.ProgressBar(max_value=max_val)
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.profile.num_thread_workers) as executor:
-            counter = 1
             future_to_page = {executor.submit(func_name, page_num=page, **func_args): page for page in page_range}
 
-            for future in concurrent.futures.as_completed(future_to_page):
+            for counter, future in enumerate(concurrent.futures.as_completed(future_to_page), start=1):
                 # page = future_to_page[future]
                 try:
                     data = future.result()
@@ -519,13 +535,10 @@ class Subject:
                             items = data['_embedded'][subject + 'Details']
                     else:
                         items = data['_embedded'][subject + 's']
-                    for item in items:
-                        all_results.append(item)
+                    all_results.extend(items)
 
                 if self.profile.use_prog_bar:
                     prog_bar.update(counter)
-                    time.sleep(0.1)
-                    counter += 1
 
         if self.profile.use_prog_bar:
             prog_bar.finish()
@@ -8,7 +8,6 @@
 |
 ******************************************************************************************************************* """
 
-import json
 from ..__exports import ExportFileType
 from ...__subject import Subject
 from ..._params import *
@@ -107,7 +106,7 @@ class Tags(Subject):
         if tag_type not in list_of_tag_types:
             raise ValueError(f"Tag Type provided ({tag_type}) is not supported.")
 
-        url = self.api_base_url.format(str(client_id))
+        url = self._client_url(client_id)
 
         body = {
             "fields": [
@@ -147,7 +146,7 @@ class Tags(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         new_tag_id = jsonified_response['id']
 
         return new_tag_id
@@ -570,14 +569,14 @@ class Tags(Subject):
             ]
         }
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(tag_id))
+        url = self._client_url(client_id) + "/{}".format(str(tag_id))
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.PUT, url, body=body)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         response_id = jsonified_response['id']
 
         return response_id
@@ -611,7 +610,7 @@ class Tags(Subject):
             "forceDeleteTicket": force_delete
         }
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(tag_id))
+        url = self._client_url(client_id) + "/{}".format(str(tag_id))
 
         try:
             self.request_handler.make_request(ApiRequestHandler.DELETE, url, body=body)
@@ -651,7 +650,7 @@ class Tags(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/history".format(str(tag_id))
+        url = self._client_url(client_id) + "/{}/history".format(str(tag_id))
 
         paginated_url = url + "?size=" + str(page_size) + "&page=" + str(page_num)
 
@@ -660,7 +659,7 @@ class Tags(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -703,7 +702,7 @@ class Tags(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/search"
+        url = self._client_url(client_id) + "/search"
 
         body = {
             "filters": search_filters,
@@ -723,7 +722,7 @@ class Tags(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -850,7 +849,7 @@ class Tags(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(tag_id))
+        url = self._client_url(client_id) + "/{}".format(str(tag_id))
 
         body = {
             "fields": [
@@ -866,7 +865,7 @@ class Tags(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         response_id = jsonified_response['id']
 
         return response_id
@@ -893,7 +892,7 @@ class Tags(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(tag_id))
+        url = self._client_url(client_id) + "/{}".format(str(tag_id))
 
         body = {
             "fields": [
@@ -909,7 +908,7 @@ class Tags(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         response_id = jsonified_response['id']
 
         return response_id
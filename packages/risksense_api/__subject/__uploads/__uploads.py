@@ -8,7 +8,7 @@
 |
 ******************************************************************************************************************* """
 
-import json
+import contextlib
 from ...__subject import Subject
 from ..._api_request_handler import *
 
@@ -58,7 +58,7 @@ class Uploads(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id))
+        url = self._client_url(client_id)
 
         params = {
             "assessmentId": assessment_id,
@@ -71,7 +71,7 @@ class Uploads(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
             raise
 
-        jsonified_response = json.dumps(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -103,7 +103,7 @@ class Uploads(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id))
+        url = self._client_url(client_id)
 
         body = {
             "assessmentId": assessment_id,
@@ -116,7 +116,7 @@ class Uploads(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         upload_id = jsonified_response['id']
 
         return upload_id
@@ -143,14 +143,14 @@ class Uploads(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(upload_id))
+        url = self._client_url(client_id) + "/{}".format(str(upload_id))
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         state = jsonified_response['state']
 
         return state
@@ -182,7 +182,7 @@ class Uploads(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(upload_id))
+        url = self._client_url(client_id) + "/{}".format(str(upload_id))
 
         name = kwargs.get('name', None)
         assessment_id = kwargs.get('assessment_id', None)
@@ -204,7 +204,7 @@ class Uploads(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         job_id = jsonified_response['id']
 
         return job_id
@@ -231,7 +231,7 @@ class Uploads(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}".format(str(upload_id))
+        url = self._client_url(client_id) + "/{}".format(str(upload_id))
 
         try:
             self.request_handler.make_request(ApiRequestHandler.DELETE, url)
@@ -271,7 +271,7 @@ class Uploads(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/file".format(str(upload_id))
+        url = self._client_url(client_id) + "/{}/file".format(str(upload_id))
 
         params = {
             "size": page_size,
@@ -283,7 +283,7 @@ class Uploads(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
 
         return jsonified_response
 
@@ -316,22 +316,66 @@ class Uploads(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/file".format(str(upload_id))
-
-        upload_file = {'scanFile': (file_name, open(path_to_file, 'rb'))}
+        url = self._client_url(client_id) + "/{}/file".format(str(upload_id))
 
         try:
-            raw_response = self.request_handler.make_request(ApiRequestHandler.POST, url, files=upload_file)
+            with open(path_to_file, 'rb') as scan_file:
+                upload_file = {'scanFile': (file_name, scan_file)}
+                raw_response = self.request_handler.make_request(ApiRequestHandler.POST, url, files=upload_file)
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
         except FileNotFoundError:
             raise
 
-        jsonified_response = json.loads(raw_response.text)
+        jsonified_response = parse_json_response(raw_response)
         file_id = jsonified_response[0]['id']
 
         return file_id
 
+    def add_files(self, upload_id, files, client_id=None):
+
+        """
+        Add several files to an upload in a single request.
+
+        :param upload_id:   Upload ID
+        :type  upload_id:   int
+
+        :param files:       List of (file_name, path_to_file) tuples, indicating the name to be used
+                            for each uploaded file, and the full path to the file to be uploaded.
+        :type  files:       list
+
+        :param client_id:   Client ID.  If an ID isn't passed, will use the profile's default Client ID.
+        :type  client_id:   int
+
+        :return:    The file IDs are returned.
+        :rtype:     list
+
+        :raises RequestFailed:
+        :raises StatusCodeError:
+        :raises MaxRetryError:
+        :raises FileNotFoundError:
+        """
+
+        if client_id is None:
+            client_id = self._use_default_client_id()[0]
+
+        url = self._client_url(client_id) + "/{}/file".format(str(upload_id))
+
+        try:
+            with contextlib.ExitStack() as stack:
+                upload_files = [('scanFile', (file_name, stack.enter_context(open(path_to_file, 'rb'))))
+                                for file_name, path_to_file in files]
+                raw_response = self.request_handler.make_request(ApiRequestHandler.POST, url, files=upload_files)
+        except (RequestFailed, StatusCodeError, MaxRetryError):
+            raise
+        except FileNotFoundError:
+            raise
+
+        jsonified_response = parse_json_response(raw_response)
+        file_ids = [uploaded_file['id'] for uploaded_file in jsonified_response]
+
+        return file_ids
+
     def update_file(self, upload_id, file_id, client_id=None, **kwargs):
 
         """
@@ -362,7 +406,7 @@ class Uploads(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/file/{}".format(str(upload_id), str(file_id))
+        url = self._client_url(client_id) + "/{}/file/{}".format(str(upload_id), str(file_id))
 
         assessment_id = kwargs.get('assessment_id', None)
         network_id = kwargs.get('network_id', None)
@@ -384,7 +428,7 @@ class Uploads(Subject):
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
 
-        jsonified_response = json.loads(raw_response)
+        jsonified_response = parse_json_response(raw_response)
         returned_id = jsonified_response['id']
 
         return returned_id
@@ -414,7 +458,7 @@ class Uploads(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/file/{}".format(str(upload_id), str(file_id))
+        url = self._client_url(client_id) + "/{}/file/{}".format(str(upload_id), str(file_id))
 
         try:
             self.request_handler.make_request(ApiRequestHandler.DELETE, url)
@@ -452,7 +496,7 @@ class Uploads(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/file/download".format(str(upload_id))
+        url = self._client_url(client_id) + "/{}/file/download".format(str(upload_id))
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
@@ -497,7 +541,7 @@ class Uploads(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/file/{}".format(str(upload_id), str(file_uuid))
+        url = self._client_url(client_id) + "/{}/file/{}".format(str(upload_id), str(file_uuid))
 
         try:
             raw_response = self.request_handler.make_request(ApiRequestHandler.GET, url)
@@ -537,7 +581,7 @@ class Uploads(Subject):
         if client_id is None:
             client_id = self._use_default_client_id()[0]
 
-        url = self.api_base_url.format(str(client_id)) + "/{}/start".format(str(upload_id))
+        url = self._client_url(client_id) + "/{}/start".format(str(upload_id))
 
         body = {
             "autoUrba": auto_urba
@@ -8,7 +8,7 @@
 |
 ******************************************************************************************************************* """
 
-from ._api_request_handler import ApiRequestHandler
+from ._api_request_handler import ApiRequestHandler, parse_json_response
 from ._exceptions import *
 
 
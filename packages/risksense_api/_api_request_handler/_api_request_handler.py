@@ -12,6 +12,16 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3 import Retry
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
 from ..__version__ import __version__
 from ._exceptions import *
 
@@ -19,6 +29,108 @@ from ._exceptions import *
 USER_AGENT = "risksense_api/" + __version__
 
 
+def parse_json_response(response):
+
+    """
+    Parse the JSON body of a response.  orjson is used if it is installed, as it
+    is considerably faster than the json module.  Either way, the raw response bytes
+    are parsed directly, rather than first being decoded to text.
+
+    :param response:    Response object from Requests Module
+    :type  response:    Requests Response Object
+
+    :return:    The parsed JSON body
+    :rtype:     dict
+    """
+
+    return _json.loads(response.content)
+
+
+def _serialize_json_body(body):
+
+    """
+    Serialize a request body to JSON, using orjson if it is installed.
+
+    :param body:    Body to be serialized
+    :type  body:    dict
+
+    :return:    The serialized body, or None if there is no body
+    :rtype:     bytes
+    """
+
+    if body is None:
+        return None
+
+    return _json.dumps(body)
+
+
+class _IdempotentTimeoutRetry(Retry):
+
+    """
+    Retry policy that doesn't retry a POST after a gateway timeout (504).  The platform
+    may have finished the work anyway, so re-sending it could create duplicates.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 504 and method.upper() == ApiRequestHandler.POST:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class _StreamedMultipart:
+
+    """
+    Multipart body that is streamed from the files being uploaded, rather than being
+    built in memory.  Unlike a plain MultipartEncoder, the body can be rewound to the
+    start, so that it can be sent again if the request is retried.
+    """
+
+    def __init__(self, files):
+
+        """
+        Initialize the streamed body.
+
+        :param files:   Files, in the form accepted by the files argument of Requests
+        :type  files:   dict or list
+        """
+
+        self.__files = list(files.values()) if isinstance(files, dict) else [value for _, value in files]
+        self.__fields = files
+        self.__encoder = MultipartEncoder(fields=files)
+        self.__boundary = self.__encoder.boundary_value
+        self.__position = 0
+
+    @property
+    def content_type(self):
+        return self.__encoder.content_type
+
+    def __len__(self):
+        return self.__encoder.len
+
+    def read(self, size=-1):
+        chunk = self.__encoder.read(size)
+        self.__position += len(chunk)
+        return chunk
+
+    def tell(self):
+        return self.__position
+
+    def seek(self, offset, whence=0):
+
+        """
+        Rewind the body.  Only seeking back to the start is supported.
+        """
+
+        if offset != 0 or whence != 0:
+            raise OSError("A streamed multipart body can only be rewound to the start.")
+
+        for value in self.__files:
+            value[1].seek(0)
+
+        self.__encoder = MultipartEncoder(fields=self.__fields, boundary=self.__boundary)
+        self.__position = 0
+
+
 class ApiRequestHandler:
 
     """ API Request Handler for the RiskSense Platform """
@@ -91,9 +203,8 @@ class ApiRequestHandler:
         :rtype:     Response
         """
 
+        #  User-Agent and x-api-key are set on the session itself.
         header = {
-            "User-Agent": self.user_agent,
-            "x-api-key": self.api_key,
             "accept": "application/json"
         }
 
@@ -135,24 +246,37 @@ class ApiRequestHandler:
 
         return response
 
-    def __requests_retry_session(self, backoff_factor=0.5, status_forcelist=(429, 502, 503)):
+    def __requests_retry_session(self, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504),
+                                 pool_connections=16, pool_maxsize=32):
 
         """
-        Create a Requests session that uses automatic retries.
+        Create a Requests session that uses automatic retries.  Connections are
+        kept alive and pooled, so the session should be reused between requests.
 
         :param backoff_factor:      Backoff factor used to calculate time between retries.
         :type  backoff_factor:      float
 
         :param status_forcelist:    A tuple containing the response status codes that should trigger a retry.
+                                    POSTs are not retried after a 504.
         :type  status_forcelist:    tuple
 
+        :param pool_connections:    Number of connection pools to cache.
+        :type  pool_connections:    int
+
+        :param pool_maxsize:        Maximum number of connections to keep in each pool.
+        :type  pool_maxsize:        int
+
         :return:    Requests Session
         :rtype:     Request
         """
 
         session = requests.Session()
+        session.headers.update({
+            "User-Agent": self.user_agent,
+            "x-api-key": self.api_key
+        })
 
-        retry = Retry(
+        retry = _IdempotentTimeoutRetry(
             total=self.max_retries,
             read=self.max_retries,
             connect=self.max_retries,
@@ -162,7 +286,7 @@ class ApiRequestHandler:
                                         ApiRequestHandler.PUT, ApiRequestHandler.DELETE])
         )
 
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
         session.mount('http://', adapter)
         session.mount('https://', adapter)
 
@@ -190,18 +314,18 @@ class ApiRequestHandler:
 
         try:
             response = req_func(**func_params)
-            try:
-                self.__valid_response(response)
-            except AssertionError:
-                if self.__check_for_page_size_error(response):
-                    raise PageSizeError("Maximum page size must be less than or equal to 1000.")
-                error_message = self._get_status_code_error(response)
-                raise StatusCodeError(error_message)
         except requests.exceptions.RetryError:
             raise MaxRetryError(self._max_retries_message + " {}".format(func_params['url']))
         except Exception as ex:
             raise RequestFailed(self._generic_failure_message + " " + str(ex))
 
+        #  Only the status code is checked here; the body is only read if the request failed.
+        if not self.__valid_response(response):
+            if self.__check_for_page_size_error(response):
+                raise PageSizeError("Maximum page size must be less than or equal to 1000.")
+            error_message = self._get_status_code_error(response)
+            raise StatusCodeError(error_message, status_code=response.status_code)
+
         return response
 
     def _get(self, url, header, params):
@@ -262,12 +386,10 @@ class ApiRequestHandler:
 
         #  If there are files involved for uploading...
         if files is not None:
-            header.pop('content-type', None)
-            header.pop('accept', None)
-            func_params = {'url': url, 'headers': header, 'files': files, 'proxies': self.proxy}
+            func_params = self._file_upload_params(url, header, files)
         #  If there aren't files involved for uploading, send a regular POST request.
         else:
-            func_params = {'url': url, 'headers': header, 'json': body, 'proxies': self.proxy}
+            func_params = {'url': url, 'headers': header, 'data': _serialize_json_body(body), 'proxies': self.proxy}
 
         try:
             response = self._request_and_validate(self.__retry_session.post, **func_params)
@@ -276,6 +398,36 @@ class ApiRequestHandler:
 
         return response
 
+    def _file_upload_params(self, url, header, files):
+
+        """
+        Build the parameters for a request that uploads files.  The files are streamed
+        if requests-toolbelt is installed, so that large files aren't read into memory.
+
+        :param url:     Endpoint URL
+        :type  url:     str
+
+        :param header:  Header
+        :type  header:  dict
+
+        :param files:   Files
+        :type  files:   dict
+
+        :return:    Parameters for the request
+        :rtype:     dict
+        """
+
+        header.pop('content-type', None)
+        header.pop('accept', None)
+
+        if MultipartEncoder is None:
+            return {'url': url, 'headers': header, 'files': files, 'proxies': self.proxy}
+
+        streamed_body = _StreamedMultipart(files)
+        header.update({'content-type': streamed_body.content_type})
+
+        return {'url': url, 'headers': header, 'data': streamed_body, 'proxies': self.proxy}
+
     def _put(self, url, header, body, files):
 
         """
@@ -303,12 +455,10 @@ class ApiRequestHandler:
 
         #  If there are files involved for uploading...
         if files is not None:
-            header.pop('content-type', None)
-            header.pop('accept', None)
-            func_params = {'url': url, 'headers': header, 'files': files, 'proxies': self.proxy}
+            func_params = self._file_upload_params(url, header, files)
         #  If there aren't files involved for uploading, send a regular PUT request.
         else:
-            func_params = {'url': url, 'headers': header, 'json': body, 'proxies': self.proxy}
+            func_params = {'url': url, 'headers': header, 'data': _serialize_json_body(body), 'proxies': self.proxy}
 
         try:
             response = self._request_and_validate(self.__retry_session.put, **func_params)
@@ -356,9 +506,12 @@ class ApiRequestHandler:
 
         :param response_to_validate:    Response object from Requests Module
         :type  response_to_validate:    Requests Response Object
+
+        :return:    Whether or not the response contains a success code
+        :rtype:     bool
         """
 
-        assert 200 <= response_to_validate.status_code <= 299
+        return 200 <= response_to_validate.status_code <= 299
 
     @staticmethod
     def __check_for_page_size_error(response):
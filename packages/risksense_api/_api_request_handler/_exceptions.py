@@ -17,6 +17,10 @@ class RequestFailed(Exception):
 class StatusCodeError(RequestFailed):
     """ Extension of RequestFailed class for Request Status Code errors"""
 
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
 
 class MaxRetryError(RequestFailed):
     """ Extension of RequestFailed class for Maximum Retry errors"""
@@ -39,6 +39,9 @@ class Profile:
 
         self.proxy = None
 
+        #  Shared ApiRequestHandler, so that all subjects use the same pooled session.
+        self.request_handler = None
+
         if self.platform_url == '':
             raise ValueError("No platform URL provided.")
 
@@ -10,6 +10,7 @@
 
 from .__version__ import __version__
 from ._profile import *
+from ._params import *
 from ._api_request_handler import *
 
 from .__subject.__application_findings import ApplicationFindings
@@ -78,6 +79,10 @@ class RiskSenseApi:
         self.__proxy_password = proxy_password
 
         self.__use_prog_bar = kwargs.get("use_prog_bar", False)
+        self.__user_agent = kwargs.get("user_agent", None)
+
+        #  A previously fetched client list may be supplied, to save querying the platform for it.
+        self.my_clients = kwargs.get("my_clients", None)
 
         try:
             self.__profile = Profile(self.__platform_url, self.__api_key, use_prog_bar=self.__use_prog_bar)
@@ -102,11 +107,12 @@ class RiskSenseApi:
                 raise
 
         #  Fetch your user's clients and add them all to a list
-        try:
-            client_search_response = self.clients.get_clients(page_size=1000)
-            self.my_clients = client_search_response['_embedded']['clients']
-        except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
-            raise
+        if self.my_clients is None:
+            try:
+                client_search_response = self.clients.get_clients(page_size=1000, sort_field=SortField.NAME)
+                self.my_clients = client_search_response['_embedded']['clients']
+            except (RequestFailed, StatusCodeError, MaxRetryError, PageSizeError):
+                raise
 
         #  If user is single-client, automatically set the default client ID
         if len(self.my_clients) == 1:
@@ -150,7 +156,7 @@ class RiskSenseApi:
         """
 
         try:
-            client_search_response = self.clients.get_clients(page_size=1000)
+            client_search_response = self.clients.get_clients(page_size=1000, sort_field=SortField.NAME)
             self.my_clients = client_search_response['_embedded']['clients']
         except (RequestFailed, StatusCodeError, MaxRetryError):
             raise
@@ -180,6 +186,13 @@ class RiskSenseApi:
         Instantiates all subjects
         """
 
+        #  All subjects share a single request handler (and its connection pool).
+        if self.__user_agent is None:
+            self.__profile.request_handler = ApiRequestHandler(self.__profile.api_key, proxy=self.__profile.proxy)
+        else:
+            self.__profile.request_handler = ApiRequestHandler(self.__profile.api_key, proxy=self.__profile.proxy,
+                                                               user_agent=self.__user_agent)
+
         self.application_findings = ApplicationFindings(self.__profile)
         self.application_unique_findings = ApplicationUniqueFindings(self.__profile)
         self.applications = Applications(self.__profile)
@@ -10,20 +10,104 @@
 ******************************************************************************************************************* """
 
 import time
-import shutil
+import random
+import json
+import hashlib
+import functools
 import datetime
 import sys
 import os
+import atexit
+import concurrent.futures
+import queue
 import logging
+import logging.handlers
 import argparse
-import toml
-from toml import TomlDecodeError
+try:
+    import tomllib
+except ModuleNotFoundError:
+    #  tomllib is only included in the standard library from Python 3.11
+    import tomli as tomllib
 import progressbar
 from packages import risksense_api as rsapi
 
 __version__ = "1.1.3"
 USER_AGENT_STRING = "upload_to_platform_v" + __version__
 
+#  Folder containing this script; relative config/log/file paths are resolved against it.
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+#  Default and maximum number of files to upload concurrently.
+UPLOAD_WORKERS = 4
+MAX_UPLOAD_WORKERS = 6
+
+#  Files smaller than this (in bytes) are sent several to a request, up to this many bytes per request.
+UPLOAD_BATCH_BYTES = 20 * 1024 * 1024
+
+#  Maximum number of files sent in a single request, to bound the number of files held open at once.
+UPLOAD_BATCH_FILES = 50
+
+#  Bounds (in seconds) of the backoff used while polling the processing state of an upload.
+POLL_DELAY_MIN = 2.0
+POLL_DELAY_MAX = 60.0
+
+#  Number of consecutive failed state checks tolerated before giving up on monitoring an upload.
+POLL_MAX_FAILURES = 3
+
+#  Upload states in which processing has ended, one way or another.
+FINAL_PROCESS_STATES = frozenset({"COMPLETE", "COMPLETE_WITH_FAILURES", "ERROR",
+                                  "FAILED", "PARSE_FAILED", "AGGREGATION_FAILED"})
+
+#  Cache of platform lookups (e.g. networks) that rarely change, and how long (in seconds) entries remain valid.
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "rs_upload", "ids.json")
+CACHE_TTL = 24 * 60 * 60
+
+#  Page size for network searches.  The platform allows up to 1000 results per page.
+NETWORK_SEARCH_PAGE_SIZE = 1000
+
+#  The log file is rotated once it reaches LOG_MAX_BYTES, keeping LOG_BACKUP_COUNT old logs.
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+#  Files in the files folder that should never be uploaded.
+IGNORED_FILES = {"PLACE_FILES_TO_SCAN_HERE.txt"}
+
+log = logging.getLogger("upload_to_platform")
+
+
+def api_call(operation, action):
+
+    """
+    Decorator for UploadToPlatform methods that make calls to the RiskSense API.  If the
+    call fails, the failure is reported and logged, and the script exits.
+
+    :param operation:   Description of the operation, used as the subject of messaging
+                        (e.g. "The creation of a new upload")
+    :type  operation:   str
+
+    :param action:      Description of the action, used when reporting unexpected errors
+                        (e.g. "creating a new upload")
+    :type  action:      str
+    """
+
+    def decorator(func):
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except rsapi.MaxRetryError as ex:
+                log.critical("ERROR. %s has reached the maximum number of retries, and failed:\n%s", operation, ex)
+            except rsapi.RequestFailed as ex:
+                log.critical("ERROR. %s has failed:\n%s", operation, ex)
+            except Exception as ex:
+                log.critical("ERROR. There was an unexpected problem %s.\n%s", action, ex)
+            exit(1)
+
+        return wrapper
+
+    return decorator
+
 
 class UploadToPlatform:
 
@@ -41,7 +125,7 @@ class UploadToPlatform:
         print("------------------------------------------------------------------\n")
 
         #  Read the config
-        conf_file = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'conf', 'config.toml')
+        conf_file = os.path.join(SCRIPT_DIR, 'conf', 'config.toml')
         config = self.read_config_file(conf_file)
 
         #  Process any args passed by the user, and set variables appropriately.
@@ -50,21 +134,41 @@ class UploadToPlatform:
             use_proxy, proxy_host, proxy_port, proxy_auth, proxy_user, proxy_pwd = self.process_args(args)
 
         #  Specify Settings For the Log
-        log_file = os.path.join(os.path.abspath(os.path.dirname(__file__)), log_folder, 'uploads.log')
-        logging.basicConfig(filename=log_file, level=logging.DEBUG,
-                            format='%(levelname)s:  %(asctime)s > %(message)s', datefmt='%m/%d/%Y %I:%M:%S %p')
-        logging.info("Date: %s", today)
-        logging.info("Time: %s", current_time)
+        log_file = os.path.join(SCRIPT_DIR, log_folder, 'uploads.log')
+        self.configure_logging(log_file, args.verbose)
+        log.info("Date: %s", today)
+        log.info("Time: %s", current_time)
+
+        #  Get info about files available to be uploaded.  This is done before contacting the
+        #  platform, so that there is no wasted work if there is nothing to upload.
+        files, path_to_files = self.process_files(file_path)
+
+        #  Load cached lookups.  Entries are keyed by platform and a hash of the API key.
+        #  With --refresh_cache, cached lookups are ignored, but are still replaced by fresh ones.
+        self._cache = self.read_cache_file(CACHE_FILE)
+        self._use_cache = not args.refresh_cache
+        self._cache_prefix = rs_platform + "|" + hashlib.sha256(api_key.encode()).hexdigest()
+
+        #  The user's clients rarely change, so a cached list is used if there is one.
+        my_clients = self.get_cached("clients")
+        self._clients_cached = my_clients is not None
 
         #  Create RiskSenseApi instance for communicating with the platform
         if use_proxy:
             if proxy_auth:
-                self.rs = rsapi.RiskSenseApi(rs_platform, api_key, proxy_host, proxy_port, proxy_user, proxy_pwd)
+                self.rs = rsapi.RiskSenseApi(rs_platform, api_key, proxy_host, proxy_port, proxy_user, proxy_pwd,
+                                             user_agent=USER_AGENT_STRING, my_clients=my_clients)
             else:
-                self.rs = rsapi.RiskSenseApi(rs_platform, api_key, proxy_host, proxy_port)
+                self.rs = rsapi.RiskSenseApi(rs_platform, api_key, proxy_host, proxy_port,
+                                             user_agent=USER_AGENT_STRING, my_clients=my_clients)
         else:
-            self.rs = rsapi.RiskSenseApi(rs_platform, api_key)
+            self.rs = rsapi.RiskSenseApi(rs_platform, api_key, user_agent=USER_AGENT_STRING, my_clients=my_clients)
+
+        if not self._clients_cached:
+            self.set_cached(self.rs.my_clients, "clients")
 
+        #  Index the user's clients by ID for quick validation
+        self._client_ids = {client['id']: client for client in self.rs.my_clients}
         #  Validate client_id provided in args/config or get the user to choose one
         if client_id is not None:
             print("Validating the provided client ID...")
@@ -86,9 +190,6 @@ class UploadToPlatform:
         else:
             self.validate_network_id(network_id)
 
-        # Get info about files available to be uploaded.
-        files, path_to_files = self.process_files(file_path)
-
         #  Start defining parameters for new assessment
         assessment_name = "assmnt_" + str(today) + "_" + str(current_time)
         assessment_start_date = str(today)
@@ -113,31 +214,56 @@ class UploadToPlatform:
 
         #  Start uploading files
         print("Uploading File(s)...")
-        num_upload_errors = self.upload_files(upload_id, files, path_to_files)
-
-        #  If the number of upload errors is less than the number of files, start processing them.
-        if num_upload_errors < len(files):
+        uploaded_files = self.upload_files(upload_id, files, args.upload_concurrency)
+
+        #  If any files were successfully uploaded, start processing them.
+        if len(uploaded_files) > 0:
+            #  The files have been uploaded, so they are archived in the background while processing is
+            #  requested and monitored.  They are archived even if processing fails to start.
+            archiver = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            archive_future = archiver.submit(self.archive_files, uploaded_files, path_to_files)
+            archiver.shutdown(wait=False)
             self.begin_upload_processing(upload_id, auto_urba)
         else:
             print(f"There were no files that were successfully uploaded.  Exiting.")
             print()
-            input("Hit ENTER to close.")
+            self.pause("Hit ENTER to close.")
             exit(1)
 
         #  Begin monitoring processing of the uploaded files until complete
         print("Now monitoring the processing state of your uploaded files...")
-        time.sleep(15)
-        process_state = ""
+        previous_state = None
+        poll_delay = POLL_DELAY_MIN
+        failed_checks = 0
 
-        while process_state != "COMPLETE":
+        while True:
             process_state = self.check_processing_state(upload_id)
 
-            if process_state in ["COMPLETE", "COMPLETE_WITH_FAILURES", "ERROR",
-                                 "FAILED", "PARSE_FAILED", "AGGREGATION_FAILED"]:
+            if process_state is None:
+                #  The platform may be briefly unavailable; wait the longest delay before trying again.
+                failed_checks += 1
+                if failed_checks > POLL_MAX_FAILURES:
+                    print(f"Please log in to the platform to monitor the status of this upload.")
+                    self.pause("Hit ENTER to close.")
+                    exit(1)
+                time.sleep(POLL_DELAY_MAX + random.uniform(0, POLL_DELAY_MAX * 0.1))
+                continue
+
+            failed_checks = 0
+
+            if process_state in FINAL_PROCESS_STATES:
                 break
-            else:
+
+            #  The state is only reported when it changes, rather than once per poll.  Polling is
+            #  quick after a change, then backs off while the state holds.
+            if process_state != previous_state:
                 print(f"Process state is currently: {process_state}.")
-                time.sleep(15)
+                log.info("Process state: %s", process_state)
+                previous_state = process_state
+                poll_delay = POLL_DELAY_MIN
+
+            time.sleep(poll_delay + random.uniform(0, poll_delay * 0.1))
+            poll_delay = min(poll_delay * 1.5, POLL_DELAY_MAX)
 
         print()
         processing_finished_msg = "Processing of uploaded file(s) has ended. " \
@@ -145,9 +271,17 @@ class UploadToPlatform:
         if auto_urba:
             processing_finished_msg += "\nRiskSense will now begin the Update Remediation By Assessment (URBA) process."
         print(processing_finished_msg)
-        logging.info("Processing of uploaded files has ended.  State: %s", process_state)
+        log.info("Processing of uploaded files has ended.  State: %s", process_state)
         print()
-        input("Hit ENTER to close.")
+
+        #  Wait for archiving to finish, if it hasn't already, and report any problem with it.
+        try:
+            archive_future.result()
+        except OSError as ex:
+            log.error("Unable to archive the uploaded files:\n%s", ex)
+            print()
+
+        self.pause("Hit ENTER to close.")
 
     def validate_client_id(self, client):
 
@@ -158,19 +292,15 @@ class UploadToPlatform:
         :type  client:      int
         """
 
-        valid_flag = False
-
-        for item in self.rs.my_clients:
-            if client == item['id']:
-                valid_flag = True
+        #  The client may have been added since the client list was cached, so check with the platform.
+        if client not in self._client_ids and self._clients_cached:
+            self.refresh_clients()
 
-        if valid_flag:
+        if client in self._client_ids:
             print(" - Client ID validated.")
             print()
         else:
-            message = "Unable to validate client ID provided: " + str(client)
-            print(message)
-            logging.error(message)
+            log.error("Unable to validate client ID provided: %s", client)
             print(f"Please provide a valid client ID. Exiting...")
             exit(1)
 
@@ -183,8 +313,6 @@ class UploadToPlatform:
         :type  network_id:  int
         """
 
-        found_networks = None
-
         network_search_filter = [
             {
                 "field": "id",
@@ -196,36 +324,20 @@ class UploadToPlatform:
 
         print(f"Validating the provided network ID...")
 
-        try:
-            found_networks = self.rs.networks.search(network_search_filter)
-        except (rsapi.RequestFailed, rsapi.StatusCodeError) as ex:
-            print(f"The search for available networks has failed:")
-            print(ex)
-            logging.critical("ERROR. The search for available networks has failed:")
-            logging.critical(ex)
-            exit(1)
-        except rsapi.MaxRetryError as ex:
-            print(f"The search for available networks has reached the maximum number of retries, and failed:")
-            print(ex)
-            logging.critical("ERROR. The search for available networks has reached "
-                             "the maximum number of retries, and failed:")
-            logging.critical(ex)
-            exit(1)
-        except Exception as ex:
-            print("ERROR. There was an unexpected problem getting a list of available networks from the platform.")
-            print(ex)
-            logging.critical("ERROR. There was an unexpected problem getting a list "
-                             "of available networks from the platform.")
-            logging.critical("Exception: \n %s", ex)
-            exit(1)
+        if self.get_cached("network", self.rs.get_default_client_id(), network_id):
+            print(" - Network ID validated.")
+            return
+
+        found_networks = self.search_networks(network_search_filter)
 
         if len(found_networks) != 1:
             print()
             print("The provided network ID appears to be invalid.  Exiting.")
-            input("Press ENTER to close.")
+            self.pause("Press ENTER to close.")
             print()
             exit(1)
 
+        self.set_cached(True, "network", self.rs.get_default_client_id(), network_id)
         print(" - Network ID validated.")
 
     def find_network_id(self):
@@ -241,72 +353,63 @@ class UploadToPlatform:
         network = 0
         found_networks = None
 
-        logging.info("Getting Network ID")
+        log.info("Getting Network ID")
 
         num_networks = self.find_network_count()
+
+        #  A single available network was already fetched while counting; no need to search again.
         if num_networks == 1:
-            network_search_filter = []
-        else:
-            print("An upload must be associated with a network.")
-            print("We will search your networks to help you identify which you would like to use.")
-            print()
-            search_value = input("Input a search string to search for your desired network name (or hit 'ENTER' to list all available networks): ")
-            logging.info("Customer search string: %s", search_value)
+            return self._all_networks[0]['id']
 
-            logging.info("Querying networks based on your search string")
+        print("An upload must be associated with a network.")
+        print("We will search your networks to help you identify which you would like to use.")
+        print()
+        #  The search string may be supplied via the environment, e.g. for unattended runs.
+        search_value = os.environ.get("RS_NETWORK_SEARCH")
+        if search_value is None:
+            search_value = self.read_input("Input a search string to search for your desired network name (or hit 'ENTER' to list all available networks): ")
+        log.info("Customer search string: %s", search_value)
 
-            network_search_filter = [
-                {
-                    "field": "name",
-                    "exclusive": False,
-                    "operator": "LIKE",
-                    "value": search_value
-                }
-            ]
+        log.info("Querying networks based on your search string")
 
-        try:
-            found_networks = self.rs.networks.search(network_search_filter)
-        except (rsapi.RequestFailed, rsapi.StatusCodeError) as ex:
-            print(f"The search for available networks has failed:")
-            print(ex)
-            logging.critical("ERROR. The search for available networks has failed:")
-            logging.critical(ex)
-            exit(1)
-        except rsapi.MaxRetryError as ex:
-            print(f"The search for available networks has reached the maximum number of retries, and failed:")
-            print(ex)
-            logging.critical("ERROR. The search for available networks has reached "
-                             "the maximum number of retries, and failed:")
-            logging.critical(ex)
-            exit(1)
-        except Exception as ex:
-            print("ERROR. There was an unexpected problem getting a list of available networks from the platform.")
-            print(ex)
-            logging.critical("ERROR. There was an unexpected problem getting a list "
-                             "of available networks from the platform.")
-            logging.critical("Exception: \n %s", ex)
-            exit(1)
+        #  Only networks belonging to the selected client are returned by the platform.
+        network_search_filter = [
+            {
+                "field": "name",
+                "exclusive": False,
+                "operator": "LIKE",
+                "value": search_value
+            },
+            {
+                "field": "clientId",
+                "exclusive": False,
+                "operator": "EXACT",
+                "value": self.rs.get_default_client_id()
+            }
+        ]
+
+        found_networks = self.get_cached("networks", self.rs.get_default_client_id(), search_value)
 
-        if network_search_filter == [] and len(found_networks == 1):
-            return found_networks[0]['id']
+        #  Empty results aren't cached, so that a network added later is found on the next run.
+        if found_networks is None:
+            found_networks = self.search_networks(network_search_filter)
+            if found_networks:
+                self.set_cached(found_networks, "networks", self.rs.get_default_client_id(), search_value)
 
         if len(found_networks) == 0:
             print()
             print("No such network found.  Exiting.")
-            input("Press ENTER to close.")
+            self.pause("Press ENTER to close.")
             print()
             exit(1)
         elif len(found_networks) >= 1:
-            network_list = []
-            for z in range(0, len(found_networks)):
-                if found_networks[z]['clientId'] == self.rs.get_default_client_id():
-                    network_list.append([found_networks[z]['id'], found_networks[z]['name']])
+            network_list = [(found_network['id'], found_network['name']) for found_network in found_networks]
 
-            for y in range(0, len(network_list)):
-                print(f"{y} - {network_list[y][1]}")
+            print("\n".join(f"{y} - {name}" for y, (_, name) in enumerate(network_list)))
 
-            list_id = input("Enter the number above that is associated with the network that you would like to select: ")
-            network = network_list[int(list_id)][0]
+            list_id = self.prompt_for_index(len(network_list), "Enter the number above that is associated "
+                                                               "with the network that you would like to select: ")
+            network = network_list[list_id][0]
 
         return network
 
@@ -331,22 +434,26 @@ class UploadToPlatform:
         proxy_auth = arguments.proxy_auth
         proxy_user = arguments.proxy_user
         proxy_pwd = arguments.proxy_pwd
+        auto_urba = arguments.auto_urba
 
         if api_key == "":
             self.no_api_key()
 
-        if arguments.auto_urba == "true":
-            auto_urba = True
-        elif arguments.auto_urba == "false":
-            auto_urba = False
-        else:
-            auto_urba = arguments.auto_urba
-
         if client_id is not None:
             client_id = int(client_id)
 
+        #  The network ID may also be supplied via the environment, e.g. for unattended runs.
+        if network_id is None and os.environ.get("RS_NETWORK_ID"):
+            network_id = os.environ["RS_NETWORK_ID"]
+
         if network_id is not None:
-            network_id = int(network_id)
+            try:
+                network_id = int(network_id)
+            except ValueError:
+                print(f"The provided network ID is not a number: {network_id}")
+                print("Please provide a valid network ID. Exiting...")
+                self.pause("Please press ENTER to close.")
+                exit(1)
 
         return rs_platform, api_key, file_path, log_folder, auto_urba, client_id, network_id, \
                use_proxy, proxy_host, proxy_port, proxy_auth, proxy_user, proxy_pwd,
@@ -363,27 +470,32 @@ class UploadToPlatform:
         print("An upload must be associated with a client.  Finding available clients...")
         print()
 
-        #  Sort list all_found_ids by client name.
+        #  The client list is fetched fresh for the menu, so that recently added clients can be chosen.
+        if self._clients_cached:
+            self.refresh_clients()
+
+        #  The platform returns clients sorted by name.  Sorting again is kept as a safeguard,
+        #  and is only a single linear pass over an already-sorted list.
         sorted_clients = sorted(self.rs.my_clients, key=lambda k: k['name'])
 
-        for x in range(0, len(sorted_clients)):
-            print(f"{x} - {sorted_clients[x]['name']}")
+        print("\n".join(f"{x} - {client['name']}" for x, client in enumerate(sorted_clients)))
 
-        selected_id = input("Enter the number above that is associated with the client that you would like to select: ")
+        if len(sorted_clients) == 0:
+            print("No clients are associated with your API key.")
+            return 0
 
-        if selected_id.isdigit() and int(selected_id) >= 0 and int(selected_id) < len(sorted_clients):
-            found_id = sorted_clients[int(selected_id)]['id']
-            print()
-        else:
-            print("You have made an invalid selection.")
-            found_id = 0
+        selected_id = self.prompt_for_index(len(sorted_clients), "Enter the number above that is associated "
+                                                                 "with the client that you would like to select: ")
+        found_id = sorted_clients[selected_id]['id']
+        print()
 
         return found_id
 
     def find_network_count(self):
 
         """
-        Get the count of available networks
+        Get the count of available networks.  The networks found are kept
+        in self._all_networks so that they can be reused without re-querying.
 
         :return:    Count of available networks
         :rtype:     int
@@ -391,31 +503,76 @@ class UploadToPlatform:
 
         network_search_filter = []
 
-        try:
-            found_networks = self.rs.networks.search(network_search_filter)
-            return len(found_networks)
+        #  Not cached: a single network is selected without asking the user, so the count must be current.
+        self._all_networks = self.search_networks(network_search_filter)
 
-        except (rsapi.RequestFailed, rsapi.StatusCodeError) as ex:
-            print(f"The search for network count has failed:")
-            print(ex)
-            logging.critical("ERROR. The search for available networks has failed:")
-            logging.critical(ex)
-            exit(1)
-        except rsapi.MaxRetryError as ex:
-            print(f"The search for network count has reached the maximum number of retries, and failed:")
-            print(ex)
-            logging.critical("ERROR. The search for network count has reached "
-                             "the maximum number of retries, and failed:")
-            logging.critical(ex)
-            exit(1)
-        except Exception as ex:
-            print("ERROR. There was an unexpected problem getting a count of available networks from the platform.")
-            print(ex)
-            logging.critical("ERROR. There was an unexpected problem getting a count "
-                             "of available networks from the platform.")
-            logging.critical("Exception: \n %s", ex)
-            exit(1)
+        return len(self._all_networks)
+
+    @api_call("The search for available networks", "getting a list of available networks from the platform")
+    def search_networks(self, network_search_filter):
+
+        """
+        Search for networks.
+
+        :param network_search_filter:   Search filter(s)
+        :type  network_search_filter:   list
+
+        :return:    ID and name of each network found
+        :rtype:     list
+        """
+
+        #  Only the ID and name are used, so the rest of each network record isn't kept or cached.
+        return [{'id': network['id'], 'name': network['name']}
+                for network in self.rs.networks.search(network_search_filter, page_size=NETWORK_SEARCH_PAGE_SIZE)]
+
+    def get_cached(self, *key):
+
+        """
+        Get a value from the lookup cache.
+
+        :param key:     Parts of the key identifying the cached value
+        :type  key:     tuple
+
+        :return:    The cached value, or None if it is missing or has expired.
+        """
+
+        if not self._use_cache:
+            return None
+
+        entry = self._cache.get("|".join([self._cache_prefix] + [str(part) for part in key]))
+
+        if entry is None or time.time() - entry['ts'] > CACHE_TTL:
+            return None
+
+        return entry['value']
+
+    def set_cached(self, value, *key):
+
+        """
+        Store a value in the lookup cache, and write the cache to disk.
 
+        :param value:   Value to cache.  Must be JSON serializable.
+
+        :param key:     Parts of the key identifying the cached value
+        :type  key:     tuple
+        """
+
+        self._cache["|".join([self._cache_prefix] + [str(part) for part in key])] = {'ts': time.time(), 'value': value}
+        self.write_cache_file(CACHE_FILE, self._cache)
+
+    @api_call("Fetching your clients", "fetching your clients")
+    def refresh_clients(self):
+
+        """
+        Re-query the platform for the user's clients, and update the cached client list.
+        """
+
+        self.rs.refresh_my_clients()
+        self._client_ids = {client['id']: client for client in self.rs.my_clients}
+        self._clients_cached = False
+        self.set_cached(self.rs.my_clients, "clients")
+
+    @api_call("The creation of a new assessment", "creating a new assessment")
     def create_new_assessment(self, assessment_name, assessment_start_date, assessment_notes):
 
         """
@@ -433,32 +590,10 @@ class UploadToPlatform:
         :return:
         :rtype:
         """
-        assessment_id = None
 
-        try:
-            assessment_id = self.rs.assessments.create(assessment_name, assessment_start_date, assessment_notes)
-        except (rsapi.RequestFailed, rsapi.StatusCodeError) as ex:
-            print(f"The creation of a new assessment has failed:")
-            print(ex)
-            logging.critical("ERROR. The creation of a new assessment has failed:")
-            logging.critical(ex)
-            exit(1)
-        except rsapi.MaxRetryError as ex:
-            print(f"The creation of a new assessment has reached the maximum number of retries, and failed:")
-            print(ex)
-            logging.critical("ERROR. The creation of a new assessment has reached "
-                             "the maximum number of retries, and failed:")
-            logging.critical(ex)
-            exit(1)
-        except Exception as ex:
-            print("ERROR. There was an unexpected problem creating a new assessment.")
-            print(ex)
-            logging.critical("ERROR. There was an unexpected problem creating a new assessment.")
-            logging.critical("Exception: \n %s", ex)
-            exit(1)
-
-        return assessment_id
+        return self.rs.assessments.create(assessment_name, assessment_start_date, assessment_notes)
 
+    @api_call("The creation of a new upload", "creating a new upload")
     def create_new_upload(self, upload_name, assessment_id, network_id):
 
         """
@@ -477,33 +612,9 @@ class UploadToPlatform:
         :rtype:     int
         """
 
-        upload_id = None
+        return self.rs.uploads.create(upload_name, assessment_id, network_id)
 
-        try:
-            upload_id = self.rs.uploads.create(upload_name, assessment_id, network_id)
-        except (rsapi.RequestFailed, rsapi.StatusCodeError) as ex:
-            print(f"The creation of a new upload has failed:")
-            print(ex)
-            logging.critical("ERROR. The creation of a new upload has failed:")
-            logging.critical(ex)
-            exit(1)
-        except rsapi.MaxRetryError as ex:
-            print(f"The creation of a new upload has reached the maximum number of retries, and failed:")
-            print(ex)
-            logging.critical("ERROR. The creation of a new upload has reached "
-                             "the maximum number of retries, and failed:")
-            logging.critical(ex)
-            exit(1)
-        except Exception as ex:
-            print("ERROR. There was an unexpected problem creating a new upload.")
-            print(ex)
-            logging.critical("ERROR. There was an unexpected problem creating a new upload.")
-            logging.critical("Exception: \n %s", ex)
-            exit(1)
-
-        return upload_id
-
-    def upload_files(self, upload_id, files, path_to_files):
+    def upload_files(self, upload_id, files, max_workers=UPLOAD_WORKERS):
 
         """
         Upload files to RiskSense.
@@ -514,54 +625,177 @@ class UploadToPlatform:
         :param files:           List of dicts indicating files to upload
         :type  files:           list
 
-        :param path_to_files:   Path to files
-        :type  path_to_files:   Path to location on disk where files exist
+        :param max_workers:     Maximum number of files to upload concurrently
+        :type  max_workers:     int
 
-        :return:    Number of upload errors that occurred
-        :rtype:     int
+        :return:    List of dicts indicating the files that were successfully uploaded
+        :rtype:     list
+        """
+
+        uploaded_files = []
+        files_done = 0
+        client_id = self.rs.get_default_client_id()
+
+        with progressbar.ProgressBar(max_value=len(files)) as bar, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_batch = {executor.submit(self.upload_batch, upload_id, batch, client_id): batch
+                               for batch in self.batch_files(files)}
+
+            try:
+                while future_to_batch:
+                    done, _ = concurrent.futures.wait(future_to_batch, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        batch = future_to_batch.pop(future)
+                        batch_uploaded, batch_retry = future.result()
+                        #  Files that weren't accepted as part of a batch are uploaded one at a time instead.
+                        for file in batch_retry:
+                            future_to_batch[executor.submit(self.upload_batch, upload_id, [file], client_id)] = [file]
+                        uploaded_files.extend(batch_uploaded)
+                        files_done += len(batch) - len(batch_retry)
+                        bar.update(files_done)
+            except KeyboardInterrupt:
+                #  Cancel the uploads that have not started yet, so only those in progress are waited on.
+                for future in future_to_batch:
+                    future.cancel()
+                raise
+
+        return uploaded_files
+
+    @staticmethod
+    def batch_files(files):
+
+        """
+        Group files into batches to be uploaded together.  Each file of UPLOAD_BATCH_BYTES
+        or more is a batch of its own, and smaller files are grouped up to that size, with
+        no more than UPLOAD_BATCH_FILES files in a batch.
+
+        :param files:   List of dicts indicating files to upload, largest first
+        :type  files:   list
+
+        :return:    List of batches, each a list of dicts indicating files to upload
+        :rtype:     list
         """
 
-        upload_errors = 0
-
-        with progressbar.ProgressBar(max_value=len(files)) as bar:
-            bar_counter = 1
-            for file in files:
-                try:
-                    self.rs.uploads.add_file(upload_id, file['name'], path_to_file=file['full_path'])
-                except FileNotFoundError as fnfe:
-                    upload_errors += 1
-                    print(f"Unable to find file {file['name']} for upload.  Moving on.")
-                    logging.critical("Unable to find file %s for upload", file['name'])
-                    logging.critical(fnfe)
-                    continue
-                except (rsapi.RequestFailed, rsapi.StatusCodeError) as ex:
-                    upload_errors += 1
-                    print(f"Uploading {file['name']} has failed:")
-                    print(ex)
-                    logging.critical("Uploading %s has failed::", file['name'])
-                    logging.critical(ex)
-                    continue
-                except rsapi.MaxRetryError as ex:
-                    upload_errors += 1
-                    print(f"Uploading {file['name']} has failed after reaching the maximum number of retries:")
-                    print(ex)
-                    logging.critical("Uploading file %s has failed after reaching the maximum number of retries", file['name'])
-                    logging.critical(ex)
-                    continue
-                except Exception as ex:
-                    upload_errors += 1
-                    print(f"ERROR. There was an unexpected problem while trying to upload file {file['name']}")
-                    print(ex)
-                    logging.critical("ERROR. There was an unexpected problem while trying to upload file %s", file['name'])
-                    logging.critical(ex)
-                    continue
-
-                shutil.move(path_to_files + "/" + file['name'], path_to_files + "/archive/" + file['name'])
-                bar.update(bar_counter)
-                time.sleep(0.1)
-                bar_counter += 1
-
-        return upload_errors
+        batches = []
+        batch = []
+        batch_bytes = 0
+
+        for file in files:
+            if batch and (batch_bytes + file['size'] > UPLOAD_BATCH_BYTES or len(batch) == UPLOAD_BATCH_FILES):
+                batches.append(batch)
+                batch = []
+                batch_bytes = 0
+            batch.append(file)
+            batch_bytes += file['size']
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def upload_batch(self, upload_id, batch, client_id):
+
+        """
+        Upload a batch of files in a single request.
+
+        :param upload_id:   Upload ID
+        :type  upload_id:   int
+
+        :param batch:       List of dicts indicating files to upload
+        :type  batch:       list
+
+        :param client_id:   Client ID
+        :type  client_id:   int
+
+        :return:    Lists of dicts indicating the files that were successfully uploaded, and the files of
+                    a batch that weren't accepted, and should be uploaded one at a time instead
+        :rtype:     tuple
+        """
+
+        if len(batch) == 1:
+            return (batch if self.upload_file(upload_id, batch[0], client_id) else []), []
+
+        try:
+            file_ids = self.rs.uploads.add_files(upload_id, [(file['name'], file['full_path']) for file in batch],
+                                                 client_id=client_id)
+        except rsapi.StatusCodeError as ex:
+            #  Only a definite rejection of the batch is retried one file at a time.  After a server
+            #  error, some of the files may have been stored, and sending them again would duplicate them.
+            if ex.status_code is not None and 400 <= ex.status_code < 500:
+                log.debug("Uploading %s files together was rejected:\n%s", len(batch), ex)
+                return [], batch
+            log.critical("Uploading %s has failed:\n%s", ", ".join(file['name'] for file in batch), ex)
+            return [], []
+        except rsapi.RequestFailed as ex:
+            log.critical("Uploading %s has failed:\n%s", ", ".join(file['name'] for file in batch), ex)
+            return [], []
+        except OSError as ex:
+            #  A file couldn't be opened, so the request was never sent.  Uploading the files one at a
+            #  time lets the rest of the batch through, and reports the file at fault.
+            log.debug("Uploading %s files together has failed:\n%s", len(batch), ex)
+            return [], batch
+        except Exception as ex:
+            #  The request was sent, but its response couldn't be understood.  The files may have been
+            #  stored, so they aren't sent again.
+            log.critical("Uploading %s has failed:\n%s", ", ".join(file['name'] for file in batch), ex)
+            return [], []
+
+        #  The platform returns an ID for each file it accepted, in the order they were sent.
+        return batch[:len(file_ids)], batch[len(file_ids):]
+
+    @staticmethod
+    def archive_files(files, path_to_files):
+
+        """
+        Move files to the "archive" subfolder of the folder they were uploaded from.
+
+        :param files:           List of dicts indicating files to archive
+        :type  files:           list
+
+        :param path_to_files:   Path to folder containing the files
+        :type  path_to_files:   str
+        """
+
+        os.makedirs(os.path.join(path_to_files, "archive"), exist_ok=True)
+
+        for file in files:
+            os.replace(file['full_path'], file['archive_path'])
+
+    def upload_file(self, upload_id, file, client_id):
+
+        """
+        Upload a single file to RiskSense.  Any errors are reported and logged here,
+        so that this can safely be run from a worker thread.
+
+        :param upload_id:   Upload ID
+        :type  upload_id:   int
+
+        :param file:        Dict indicating the file to upload
+        :type  file:        dict
+
+        :param client_id:   Client ID
+        :type  client_id:   int
+
+        :return:    Whether or not the file was successfully uploaded
+        :rtype:     bool
+        """
+
+        try:
+            self.rs.uploads.add_file(upload_id, file['name'], path_to_file=file['full_path'], client_id=client_id)
+        except FileNotFoundError as fnfe:
+            log.critical("Unable to find file %s for upload.  Moving on.\n%s", file['name'], fnfe)
+            return False
+        except (rsapi.RequestFailed, rsapi.StatusCodeError) as ex:
+            log.critical("Uploading %s has failed:\n%s", file['name'], ex)
+            return False
+        except rsapi.MaxRetryError as ex:
+            log.critical("Uploading %s has failed after reaching the maximum number of retries:\n%s", file['name'], ex)
+            return False
+        except Exception as ex:
+            log.critical("ERROR. There was an unexpected problem while trying to upload file %s\n%s", file['name'], ex)
+            return False
+
+        return True
 
     def begin_upload_processing(self, upload_id, auto_urba):
 
@@ -587,7 +821,7 @@ class UploadToPlatform:
         except (rsapi.RequestFailed, rsapi.StatusCodeError, rsapi.MaxRetryError, Exception):
             print(f"There was an unexpected issue starting the processing of your files.  Please log in"
                   f"to the platform and start the processing manually. ")
-            input("Hit ENTER to close.")
+            self.pause("Hit ENTER to close.")
             exit(1)
 
     def check_processing_state(self, upload_id):
@@ -598,18 +832,16 @@ class UploadToPlatform:
         :param upload_id:   Upload ID
         :type  upload_id:   int
 
-        :return:    Process state
+        :return:    Process state, or None if the state could not be checked
         :rtype:     str
         """
 
         try:
             process_state = self.rs.uploads.check_state(upload_id)
             return process_state
-        except (rsapi.RequestFailed, rsapi.StatusCodeError, rsapi.MaxRetryError, Exception):
-            print(f"An unexpected issue has occurred while trying to check the state of your upload.")
-            print(f"Please log in to the platform to monitor the status of this upload.")
-            input("Hit ENTER to close.")
-            exit(1)
+        except (rsapi.RequestFailed, rsapi.StatusCodeError, rsapi.MaxRetryError, Exception) as ex:
+            log.warning("An unexpected issue has occurred while trying to check the state of upload %s:\n%s", upload_id, ex)
+            return None
 
     def log_session_info(self, network_id, auto_urba, assessment_name, assessment_id,
                          assessment_start_date, assessment_notes, upload_id, path_to_files, files):
@@ -646,20 +878,21 @@ class UploadToPlatform:
         """
 
         #  Write session info to log file.
-        logging.info("")
-        logging.info(" ------- Session Info ---------")
-        logging.info(" Client ID: %s ", self.rs.get_default_client_id())
-        logging.info(" Network ID: %s ", network_id)
-        logging.info(" Auto URBA: %s ", auto_urba)
-        logging.info(" Assessment Name: %s", assessment_name)
-        logging.info(" Assessment ID: %s", assessment_id)
-        logging.info(" Assessment Start Date: %s", assessment_start_date)
-        logging.info(" Assessment Notes: %s", assessment_notes)
-        logging.info(" Upload ID: %s", upload_id)
-        logging.info(" Path to Files: %s", path_to_files)
-        logging.info(" Files: %s", files)
-        logging.info(" -----------------------------")
-        logging.info("")
+        log.info("")
+        log.info(" ------- Session Info ---------")
+        log.info(" Client ID: %s ", self.rs.get_default_client_id())
+        log.info(" Network ID: %s ", network_id)
+        log.info(" Auto URBA: %s ", auto_urba)
+        log.info(" Assessment Name: %s", assessment_name)
+        log.info(" Assessment ID: %s", assessment_id)
+        log.info(" Assessment Start Date: %s", assessment_start_date)
+        log.info(" Assessment Notes: %s", assessment_notes)
+        log.info(" Upload ID: %s", upload_id)
+        log.info(" Path to Files: %s", path_to_files)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(" Files: %s", [file['name'] for file in files])
+        log.info(" -----------------------------")
+        log.info("")
 
     @staticmethod
     def no_api_key():
@@ -670,11 +903,102 @@ class UploadToPlatform:
                   "Please supply an API Key by one of the following methods: \n" \
                   " - Add to the configuration file (conf/config.toml) \n" \
                   " - Provide as an argument when executing script."
+        #  Logging hasn't been configured yet when the arguments are processed.
         print(message)
-        logging.info(message)
-        input("Please press ENTER to close.")
+        UploadToPlatform.pause("Please press ENTER to close.")
         exit(1)
 
+    @staticmethod
+    def pause(message):
+
+        """
+        Wait for the user to hit ENTER.  Skipped when not running interactively,
+        so that unattended runs do not hang.
+
+        :param message:     Prompt to display
+        :type  message:     str
+        """
+
+        if sys.stdin.isatty():
+            input(message)
+
+    @staticmethod
+    def read_input(message):
+
+        """
+        Prompt the user for input.  Exits if there is nothing left to read.
+
+        :param message:     Prompt to display
+        :type  message:     str
+
+        :return:    The user's input
+        :rtype:     str
+        """
+
+        try:
+            return input(message)
+        except EOFError:
+            #  Nothing left to read from stdin (e.g. a non-interactive run), so no input can be read.
+            print()
+            print("No input could be read.  Exiting.")
+            exit(1)
+
+    @staticmethod
+    def prompt_for_index(num_options, message):
+
+        """
+        Prompt the user to select an item from a numbered list, until a valid selection is made.
+
+        :param num_options: Number of items in the list
+        :type  num_options: int
+
+        :param message:     Prompt to display
+        :type  message:     str
+
+        :return:    The selected index
+        :rtype:     int
+        """
+
+        while True:
+            selection = UploadToPlatform.read_input(message)
+            #  isdigit() rules out negative numbers, so only the upper bound needs checking.
+            if selection.isdigit() and int(selection) < num_options:
+                return int(selection)
+            print("You have made an invalid selection.  Please try again.")
+
+    @staticmethod
+    def configure_logging(log_file, verbose=False):
+
+        """
+        Configure logging.  Records are queued by the calling thread, and written
+        to the log file by a background listener, so logging never waits on disk I/O.
+        Warnings and errors are also shown on the console, so they don't need a separate print().
+
+        :param log_file:    Path to the log file
+        :type  log_file:    str
+
+        :param verbose:     Include debug messages in the log?
+        :type  verbose:     bool
+        """
+
+        file_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT)
+
+        log_queue = queue.Queue(-1)
+        log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        log_listener.start()
+
+        #  Make sure queued records are flushed to the file before the script exits.
+        atexit.register(log_listener.stop)
+
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.WARNING)
+        console_handler.setFormatter(logging.Formatter('%(message)s'))
+
+        #  Records are formatted by the QueueHandler as they are queued, and written out as-is by the file handler.
+        logging.basicConfig(level=logging.DEBUG if verbose else logging.INFO,
+                            format='%(levelname)s:  %(asctime)s > %(message)s', datefmt='%m/%d/%Y %I:%M:%S %p',
+                            handlers=[logging.handlers.QueueHandler(log_queue), console_handler])
+
     @staticmethod
     def process_files(file_path):
 
@@ -684,38 +1008,87 @@ class UploadToPlatform:
         :param file_path:   Location to check for files.
         :type  file_path:   str
 
-        :return:    list of files, and full path on disk to the folder they are in
+        :return:    list of files (largest first), and full path on disk to the folder they are in
         :rtype:     tuple
         """
 
-        files = []
-
         if file_path == "files_to_process":
-            path_to_files = os.path.join(os.path.abspath(os.path.dirname(__file__)), file_path)
+            path_to_files = os.path.join(SCRIPT_DIR, file_path)
         else:
             path_to_files = file_path
 
-        #  Get filenames, but ignore subfolders.
-        filenames = [f for f in os.listdir(path_to_files) if os.path.isfile(os.path.join(path_to_files, f))]
+        archive_folder = os.path.join(path_to_files, "archive")
 
-        for x in range(0, len(filenames)):
-            if filenames[x] == "PLACE_FILES_TO_SCAN_HERE.txt":
-                continue
-            else:
-                files.append({"name": filenames[x], "full_path": os.path.join(path_to_files, filenames[x])})
+        #  Get files, but ignore subfolders and placeholder files.  Paths are built once, here.
+        with os.scandir(path_to_files) as entries:
+            files = [{"name": entry.name, "full_path": entry.path, "size": entry.stat().st_size,
+                      "archive_path": os.path.join(archive_folder, entry.name)} for entry in entries
+                     if entry.is_file() and entry.name not in IGNORED_FILES]
+
+        #  Empty files can't be processed by the platform, so they are left where they are.
+        for file in files:
+            if file['size'] == 0:
+                log.warning("Skipping empty file: %s", file['name'])
+        files = [file for file in files if file['size'] > 0]
+
+        #  Start the largest uploads first, so that they don't hold up the end of a concurrent upload.
+        files.sort(key=lambda file: file['size'], reverse=True)
 
         #  If no files are found, log, notify the user, and exit.
-        if len(filenames) == 0:
-            message = "No files found to process.  Exiting..."
+        if len(files) == 0:
             print()
-            print(message)
-            logging.info(message)
+            log.warning("No files found to process.  Exiting...")
             print()
-            input("Please press ENTER to close.")
+            UploadToPlatform.pause("Please press ENTER to close.")
             exit(1)
 
         return files, path_to_files
 
+    @staticmethod
+    def str_to_bool(value):
+
+        """
+        Convert a "true"/"false" argument to a bool.
+
+        :param value:   Argument value
+        :type  value:   str
+
+        :return:    The boolean value
+        :rtype:     bool
+
+        :raises argparse.ArgumentTypeError:
+        """
+
+        try:
+            return {"true": True, "false": False}[value.lower()]
+        except KeyError:
+            raise argparse.ArgumentTypeError(f"invalid choice: '{value}' (choose from 'true', 'false')")
+
+    @staticmethod
+    def upload_concurrency(value):
+
+        """
+        Convert an upload concurrency argument to an int, checking that it is within bounds.
+
+        :param value:   Argument value
+        :type  value:   str
+
+        :return:    The number of files to upload concurrently
+        :rtype:     int
+
+        :raises argparse.ArgumentTypeError:
+        """
+
+        try:
+            workers = int(value)
+        except ValueError:
+            workers = 0
+
+        if not 1 <= workers <= MAX_UPLOAD_WORKERS:
+            raise argparse.ArgumentTypeError(f"must be a number from 1 to {MAX_UPLOAD_WORKERS}: '{value}'")
+
+        return workers
+
     @staticmethod
     def arg_parser_setup(config):
 
@@ -735,20 +1108,63 @@ class UploadToPlatform:
         parser.add_argument('-a', '--api_key', help='API Key', type=str, required=False, default=config['api-key'])
         parser.add_argument('-f', '--files_folder', help='Path to folder containing scan files', type=str, required=False, default=config['files_folder'])
         parser.add_argument('-l', '--log_folder', help='Path to folder to write log', type=str, required=False, default=config['log_folder'])
-        parser.add_argument('-u', '--auto_urba', help='Run auto-URBA?', type=str, choices=["true", "false"], required=False, default=config['auto_urba'])
+        parser.add_argument('-u', '--auto_urba', help='Run auto-URBA? (true/false)', type=UploadToPlatform.str_to_bool, required=False, default=config['auto_urba'])
         parser.add_argument('-c', '--client_id', help='Client ID', type=int, required=False, default=config['client_id'])
         parser.add_argument('-n', '--network_id', help='Network ID', type=int, required=False, default=config['network_id'])
-        parser.add_argument('--use_proxy', help='Use Proxy?', type=bool, required=False, default=config['use_proxy'])
+        parser.add_argument('--use_proxy', help='Use Proxy? (true/false)', type=UploadToPlatform.str_to_bool, required=False, default=config['use_proxy'])
         parser.add_argument('--proxy_host', help='Proxy host', type=str, required=False, default=config['proxy']['host'])
         parser.add_argument('--proxy_port', help='Proxy port', type=int, required=False, default=config['proxy']['port'])
-        parser.add_argument('--proxy_auth', help='Use proxy authentication?', type=bool, required=False, default=config['proxy']['authentication'])
+        parser.add_argument('--proxy_auth', help='Use proxy authentication? (true/false)', type=UploadToPlatform.str_to_bool, required=False, default=config['proxy']['authentication'])
         parser.add_argument('--proxy_user', help='Proxy username', type=str, required=False, default=config['proxy']['user'])
         parser.add_argument('--proxy_pwd', help='Proxy password', type=str, required=False, default=config['proxy']['password'])
+        #  The default is passed as a string, so that argparse checks the value from the config as well.
+        parser.add_argument('--upload_concurrency', help=f'Number of files to upload concurrently (1-{MAX_UPLOAD_WORKERS})', type=UploadToPlatform.upload_concurrency, required=False, default=str(config['upload_concurrency']))
+        parser.add_argument('--refresh_cache', help='Ignore cached client and network lookups, and refresh them from the platform', action='store_true')
+        parser.add_argument('-v', '--verbose', help='Include debug messages in the log', action='store_true')
 
         args = parser.parse_args()
 
         return args
 
+    @staticmethod
+    def read_cache_file(filename):
+
+        """
+        Reads the JSON-formatted lookup cache.  A missing or unreadable cache is treated as empty.
+
+        :param filename:    Path to the cache file
+        :type  filename:    str
+
+        :return:    Cached entries
+        :rtype:     dict
+        """
+
+        try:
+            with open(filename) as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def write_cache_file(filename, cache):
+
+        """
+        Writes the lookup cache to disk.  Failure to do so is logged, but otherwise ignored.
+
+        :param filename:    Path to the cache file
+        :type  filename:    str
+
+        :param cache:       Cached entries
+        :type  cache:       dict
+        """
+
+        try:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename, 'w') as cache_file:
+                json.dump(cache, cache_file)
+        except OSError as ex:
+            log.warning("Unable to write cache file %s: %s", filename, ex)
+
     @staticmethod
     def read_config_file(filename):
 
@@ -762,33 +1178,32 @@ class UploadToPlatform:
         :rtype:   dict
         """
 
-        toml_data = {}
-
         try:
-            toml_data = open(filename).read()
-        except TomlDecodeError as tde:
+            with open(filename, 'rb') as config_file:
+                data = tomllib.load(config_file)
+        except (tomllib.TOMLDecodeError, UnicodeDecodeError) as tde:
             print("An error occurred while trying to decode your config file.  Please check it for formatting errors.")
             print(f"\n{tde}\n")
-            input("Please press ENTER to close.")
+            UploadToPlatform.pause("Please press ENTER to close.")
             exit(1)
         except FileNotFoundError as fnfe:
             print("An error occurred while trying to locate your config file. "
                   "Please verify that it exists in the \"conf\" folder.")
             print(f"\n{fnfe}\n")
-            input("Please press ENTER to close.")
+            UploadToPlatform.pause("Please press ENTER to close.")
             exit(1)
-        except Exception as ex:
-            print("An unexpected error occurred while trying to read your config file.")
-            print(f"\n{ex}\n")
-            input("Please press ENTER to close.")
+        except OSError as ose:
+            print("An error occurred while trying to read your config file.")
+            print(f"\n{ose}\n")
+            UploadToPlatform.pause("Please press ENTER to close.")
             exit(1)
 
-        data = toml.loads(toml_data)
-
         if "client_id" not in data:
             data.update({"client_id": None})
         if "network_id" not in data:
             data.update({"network_id": None})
+        if "upload_concurrency" not in data:
+            data.update({"upload_concurrency": UPLOAD_WORKERS})
 
         return data
 